@@ -9,14 +9,18 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Sequence, Dict, List, Optional
+from typing import Any, Sequence, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timedelta
 import aiohttp
 import time
 import logging
+import ssl
 from urllib.parse import urljoin
 import hashlib
+from collections import Counter, OrderedDict
 
+import numpy as np
 import pandas as pd
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -29,21 +33,227 @@ from mcp.types import (
 )
 from pydantic import BaseModel
 
+# Polars is optional; when present the local CSV fallback is scanned lazily
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# ijson is optional; when present package_show bodies are parsed as a stream
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Add the project root to Python path to import from other modules
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Only configure the root logger if the host application hasn't already
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 class SubsidyQuery(BaseModel):
     query: str
     max_results: int = 5
 
+@dataclass(slots=True, frozen=True)
+class Scheme:
+    """A government scheme record (slotted to keep per-scheme memory small)"""
+    scheme_name: str = ""
+    ministry: str = ""
+    description: str = ""
+    benefit_amount: str = ""
+    eligibility: str = ""
+    application_process: str = ""
+    documents_required: Tuple[str, ...] = ()
+    website: str = ""
+    helpline: str = ""
+    states: str = ""
+    category: str = ""
+    status: str = ""
+    last_updated: str = ""
+    data_source: str = ""
+    data_freshness: str = ""
+    dataset_id: str = ""
+    search_relevance: str = ""
+    # Rendered summary, filled on first use; replace() starts a fresh copy empty
+    _formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Scheme":
+        """Build a scheme from a loosely-typed dict, ignoring unknown keys"""
+        values = {key: data[key] for key in SCHEME_FIELDS if data.get(key) is not None}
+        docs = values.get('documents_required')
+        if docs is not None:
+            values['documents_required'] = (docs,) if isinstance(docs, str) else tuple(docs)
+        return cls(**values)
+
+    def to_dict(self) -> Dict:
+        """Plain dict view, for JSON responses at the MCP boundary"""
+        return {key: getattr(self, key) for key in SCHEME_FIELDS}
+
+    def summary(self) -> str:
+        """User-facing summary text, rendered once per scheme"""
+        if self._formatted is None:
+            formatted = f"📋 {self.scheme_name or 'Unknown Scheme'}\n"
+            formatted += f"   🏛️  Ministry: {self.ministry or 'N/A'}\n"
+            formatted += f"   📝 Description: {self.description or 'N/A'}\n"
+            formatted += f"   💰 Benefit: {self.benefit_amount or 'N/A'}\n"
+            formatted += f"   ✅ Eligibility: {self.eligibility or 'N/A'}\n"
+            formatted += f"   🏷️  Category: {self.category or 'N/A'}\n"
+            formatted += f"   🌍 States: {self.states or 'N/A'}\n"
+            
+            if self.application_process:
+                formatted += f"   📋 How to Apply: {self.application_process}\n"
+            
+            if self.documents_required:
+                docs = ', '.join(self.documents_required)
+                formatted += f"   📄 Documents: {docs}\n"
+            
+            if self.website:
+                formatted += f"   🌐 Website: {self.website}\n"
+                
+            if self.helpline:
+                formatted += f"   📞 Helpline: {self.helpline}\n"
+                
+            formatted += f"   🕒 Last Updated: {self.last_updated or 'N/A'}\n\n"
+            object.__setattr__(self, '_formatted', formatted)
+        return self._formatted
+
+SCHEME_FIELDS = tuple(f.name for f in fields(Scheme) if f.init)
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+# Dataset fields read by extract_scheme_from_dataset
+_DATASET_FIELDS = ('id', 'title', 'notes', 'description', 'organization', 'state', 'metadata_modified', 'url')
+
+# Per-request budget for Data.gov catalog and dataset calls; longer than the
+# shared session's default since package_show and search can be slow
+_DATA_GOV_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Sources reported by the live status summary
+_DATA_SOURCES = ("Data.gov API", "PM-KISAN Portal", "Digital India", "MyGov", "State Governments")
+
+# Keyword -> category rules for Data.gov results, checked in priority order
+_CATEGORY_RULES = (
+    ('insurance', 'Crop Insurance'),
+    ('credit', 'Credit Support'),
+    ('loan', 'Credit Support'),
+    ('subsidy', 'Government Subsidy'),
+    ('rural', 'Rural Development'),
+    ('crop', 'Agricultural Support'),
+    ('agriculture', 'Agricultural Support'),
+)
+
+# Portal schemes returned by the live fetchers; only last_updated varies per call
+_PMKISAN_TEMPLATE = Scheme(
+    scheme_name="PM-KISAN Status Check",
+    ministry="Ministry of Agriculture and Farmers Welfare",
+    description="Live status check for PM-KISAN scheme",
+    benefit_amount="₹6,000 per year",
+    eligibility="Landholding farmers",
+    application_process="Online portal",
+    website="https://pmkisan.gov.in",
+    status="Active",
+    data_source="live_check"
+)
+
+_DIGITAL_INDIA_TEMPLATE = Scheme(
+    scheme_name="Digital Agriculture Mission",
+    ministry="Ministry of Electronics & Information Technology",
+    description="Digital transformation of agriculture through technology adoption",
+    benefit_amount="Technology infrastructure support",
+    eligibility="Farmers, FPOs, and agricultural cooperatives",
+    application_process="Online through Digital India portal",
+    website="https://digitalindia.gov.in",
+    category="Digital Agriculture",
+    status="Active",
+    data_source="digital_india_portal"
+)
+
+_MYGOV_TEMPLATE = Scheme(
+    scheme_name="MyGov Farmer Connect Initiative",
+    ministry="Ministry of Agriculture and Farmers Welfare",
+    description="Digital platform for farmer engagement and feedback on government policies",
+    benefit_amount="Free digital services and policy participation",
+    eligibility="All farmers and citizens interested in agriculture",
+    application_process="Registration on MyGov platform",
+    documents_required=("Mobile number", "Email ID"),
+    website="https://www.mygov.in",
+    category="Digital Engagement",
+    status="Active",
+    data_source="mygov_portal"
+)
+
+_STATE_SCHEME_TEMPLATES = (
+    Scheme(
+        scheme_name="Karnataka Raitha Shakti Scheme",
+        ministry="Government of Karnataka",
+        description="Interest-free loans for farmers in Karnataka",
+        benefit_amount="Up to ₹3 lakh interest-free loan",
+        eligibility="Small and marginal farmers in Karnataka",
+        application_process="Through cooperative banks and PACS",
+        documents_required=("Aadhaar", "Land Records", "Income Certificate"),
+        states="Karnataka",
+        category="State Credit Support",
+        status="Active",
+        data_source="state_government"
+    ),
+    Scheme(
+        scheme_name="Tamil Nadu Uzhavar Sandhai",
+        ministry="Government of Tamil Nadu",
+        description="Direct marketing platform for farmers",
+        benefit_amount="No commission fees for farmers",
+        eligibility="All farmers in Tamil Nadu",
+        application_process="Registration at Uzhavar Sandhai centers",
+        states="Tamil Nadu",
+        category="Marketing Support",
+        status="Active",
+        data_source="state_government"
+    ),
+)
+
 class SubsidyMCPServer:
     def __init__(self):
         self.server = Server("subsidy-server")
+        self.logger = logger
+        
         self.df = None
+        self._lf = None
+        self._df_text = None
         self.cache = {}
         self.cache_duration = 3600  # 1 hour cache
         
+        # Freshness windows for cached Data.gov responses; stale entries are
+        # revalidated with a conditional GET rather than refetched outright
+        self.search_cache_ttl = 6 * 3600  # package_search, 6 hours
+        self.dataset_cache_ttl = 24 * 3600  # package_show, 24 hours
+        
+        # LRU cache for scheme searches; a query is only admitted once it has
+        # been seen _admit_threshold times, so one-off queries don't evict
+        # popular ones. Counts are halved every cache_duration seconds.
+        self._search_cache: OrderedDict = OrderedDict()
+        self._search_cache_size = 128
+        self._query_freq: Counter = Counter()
+        self._admit_threshold = 2
+        self._freq_decay_at = time.time() + self.cache_duration
+        
+        # Background task that refreshes live data every cache_duration seconds
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Shared HTTP session so connections to government APIs are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Caps on in-flight requests per upstream, shared by all tool calls
+        self._dgov_sema = asyncio.Semaphore(4)
+        self._pmkisan_sema = asyncio.Semaphore(2)
+        
         # Real government API endpoints and data sources
         self.api_endpoints = {
             # Data.gov API - Primary source for government data
@@ -69,10 +279,6 @@ class SubsidyMCPServer:
             'Content-Type': 'application/json'
         }
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
         self.load_subsidies_data()
         self.setup_handlers()
 
@@ -83,8 +289,9 @@ class SubsidyMCPServer:
         
         # Initialize real-world subsidy schemes (hardcoded reliable data)
         self.real_world_schemes = self.get_real_world_schemes_data()
+        self._rebuild_indices()
         
-        # Note: Live updates will be fetched when needed to avoid async issues during init
+        # Note: Live updates are refreshed in the background once start() is called
 
     def load_local_data(self):
         """Load local CSV data as fallback"""
@@ -92,209 +299,267 @@ class SubsidyMCPServer:
             csv_path = project_root / "data" / "subsidies" / "central" / "main_subsidy_data.csv"
             if csv_path.exists():
                 self.df = pd.read_csv(csv_path)
-                print(f"Loaded {len(self.df)} local subsidy records", file=sys.stderr)
+                if POLARS_AVAILABLE:
+                    self._lf = pl.scan_csv(csv_path)
+                self.logger.info("Loaded %d local subsidy records", len(self.df))
             else:
-                print(f"Warning: Local CSV file not found, using real-world data", file=sys.stderr)
+                self.logger.warning("Local CSV file not found, using real-world data")
                 self.df = pd.DataFrame()
         except Exception as e:
-            print(f"Error loading local data: {e}", file=sys.stderr)
+            self.logger.error("Error loading local data: %s", e)
             self.df = pd.DataFrame()
+        
+        self._df_text = self.build_row_text(self.df)
+
+    @staticmethod
+    def build_row_text(df: pd.DataFrame) -> pd.Series:
+        """Lowercase text of each row's non-null values joined by spaces, built column-wise"""
+        text = pd.Series('', index=df.index, dtype=object)
+        started = pd.Series(False, index=df.index)
+        for col in df.columns:
+            values = df[col]
+            present = values.notna()
+            joined = text.where(~started, text + ' ') + values.astype(str).str.lower()
+            text = joined.where(present, text)
+            started |= present
+        return text
 
-    def get_real_world_schemes_data(self) -> List[Dict]:
+    def _rebuild_indices(self):
+        """Precompute search text, lookups and counts over real_world_schemes.
+        
+        Schemes only change in load_subsidies_data and merge_live_schemes, so
+        the tool handlers read these instead of rescanning the list.
+        """
+        self._scheme_blobs: List[str] = []
+        self._scheme_name_lc: List[str] = []
+        self._scheme_cat_lc: List[str] = []
+        self._by_category: Dict[str, List[Scheme]] = {}
+        self._by_state_lower: Dict[str, List[int]] = {}
+        self._all_states: List[int] = []
+        self._fresh_schemes: List[Scheme] = []
+        self._active_count = 0
+        self._live_count = 0
+        
+        for i, scheme in enumerate(self.real_world_schemes):
+            self._scheme_blobs.append(' '.join([
+                scheme.scheme_name,
+                scheme.description,
+                scheme.category,
+                scheme.states,
+                ' '.join(scheme.documents_required)
+            ]).lower())
+            self._scheme_name_lc.append(scheme.scheme_name.lower())
+            self._scheme_cat_lc.append(scheme.category.lower())
+            self._by_category.setdefault(scheme.category or 'General', []).append(scheme)
+            
+            # State buckets hold list positions so lookups keep list order
+            states_lower = scheme.states.lower()
+            if 'all states' in states_lower:
+                self._all_states.append(i)
+            self._by_state_lower.setdefault(states_lower, []).append(i)
+            
+            if scheme.status == 'Active':
+                self._active_count += 1
+            if scheme.data_freshness in ('live', 'updated'):
+                self._live_count += 1
+            if scheme.data_freshness == 'live':
+                self._fresh_schemes.append(scheme)
+
+    def get_real_world_schemes_data(self) -> List[Scheme]:
         """Get comprehensive real-world government subsidy schemes"""
         return [
-            {
-                "scheme_name": "PM-KISAN Samman Nidhi",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Direct income support to landholding farmers families",
-                "benefit_amount": "₹6,000 per year in 3 installments",
-                "eligibility": "All landholding farmers families",
-                "application_process": "Online through PM-KISAN portal or CSC centers",
-                "documents_required": ["Aadhaar Card", "Bank Account Details", "Land Records"],
-                "website": "https://pmkisan.gov.in",
-                "helpline": "155261",
-                "states": "All States and UTs",
-                "category": "Direct Benefit Transfer",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Pradhan Mantri Fasal Bima Yojana (PMFBY)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare", 
-                "description": "Crop insurance scheme providing coverage against crop loss",
-                "benefit_amount": "Coverage up to sum insured amount",
-                "eligibility": "All farmers growing notified crops",
-                "application_process": "Through banks, CSC centers, or insurance companies",
-                "documents_required": ["Aadhaar Card", "Bank Account", "Land Records", "Sowing Certificate"],
-                "website": "https://pmfby.gov.in",
-                "helpline": "14447",
-                "states": "All States",
-                "category": "Crop Insurance",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Kisan Credit Card (KCC)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Credit facility for farmers for crop production and other needs",
-                "benefit_amount": "Credit limit based on land holding and cropping pattern",
-                "eligibility": "Farmers (individual/joint) who are owner cultivators",
-                "application_process": "Through participating banks",
-                "documents_required": ["Identity Proof", "Address Proof", "Land Documents"],
-                "website": "https://www.nabard.org/kcc.aspx",
-                "helpline": "1800-200-4291",
-                "states": "All States",
-                "category": "Credit Support",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Sub-Mission on Agricultural Mechanization (SMAM)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Financial assistance for purchase of agricultural machinery and equipment",
-                "benefit_amount": "25-50% subsidy on agricultural machinery",
-                "eligibility": "Individual farmers, SHGs, FPOs, Cooperatives",
-                "application_process": "Through State Agriculture Departments",
-                "documents_required": ["Identity Proof", "Bank Account", "Land Records"],
-                "website": "https://agrimachinery.nic.in",
-                "states": "All States",
-                "category": "Equipment Subsidy",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Paramparagat Krishi Vikas Yojana (PKVY)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Promotion of organic farming through cluster approach",
-                "benefit_amount": "₹50,000 per hectare over 3 years",
-                "eligibility": "Groups of farmers doing organic farming",
-                "application_process": "Through clusters formation and State Governments",
-                "documents_required": ["Group Formation Certificate", "Land Records"],
-                "website": "https://www.pkvy.gov.in",
-                "states": "All States",
-                "category": "Organic Farming",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "National Mission on Edible Oils - Oil Palm (NMEO-OP)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Assistance for oil palm cultivation",
-                "benefit_amount": "₹29,000 per hectare in first year",
-                "eligibility": "Farmers in suitable agro-climatic zones",
-                "application_process": "Through State implementing agencies",
-                "documents_required": ["Land Records", "Bank Account Details"],
-                "states": "Andhra Pradesh, Telangana, Karnataka, Tamil Nadu, Gujarat, Assam, Mizoram",
-                "category": "Crop Development",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "National Beekeeping and Honey Mission (NBHM)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Support for beekeeping and honey production",
-                "benefit_amount": "75% subsidy for SC/ST, 50% for others",
-                "eligibility": "Individual farmers, SHGs, FPOs",
-                "application_process": "Through State Horticulture Departments",
-                "documents_required": ["Identity Proof", "Category Certificate if applicable"],
-                "states": "All States",
-                "category": "Allied Agriculture",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Micro Irrigation Fund (MIF)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Support for micro irrigation systems",
-                "benefit_amount": "Up to 55% subsidy for micro irrigation",
-                "eligibility": "All categories of farmers",
-                "application_process": "Through State Agriculture/Horticulture Departments",
-                "documents_required": ["Land Records", "Bank Account", "Water Source Certificate"],
-                "states": "All States",
-                "category": "Irrigation Support",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Formation & Promotion of FPOs",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Support for formation of 10,000 Farmer Producer Organizations (FPOs)",
-                "benefit_amount": "₹15-33 lakh per FPO over 5 years",
-                "eligibility": "Groups of farmers, especially small and marginal",
-                "application_process": "Through Cluster Based Business Organizations (CBBOs)",
-                "documents_required": ["Group Formation Documents", "Business Plan", "Bank Account"],
-                "website": "https://www.sfacindia.com/fpo.aspx",
-                "states": "All States",
-                "category": "Institutional Support",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Interest Subvention Scheme",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Interest subvention on short term crop loans",
-                "benefit_amount": "4% interest rate (7% minus 3% subvention)",
-                "eligibility": "Farmers with KCC and crop loans up to ₹3 lakh",
-                "application_process": "Through banks issuing crop loans",
-                "documents_required": ["KCC", "Loan Application", "Crop Details"],
-                "states": "All States",
-                "category": "Credit Support",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "National Mission for Sustainable Agriculture (NMSA)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Promoting sustainable agriculture through climate resilient practices",
-                "benefit_amount": "Varies by component (50-100% for demos, 50% for equipment)",
-                "eligibility": "All farmers, with focus on climate vulnerable areas",
-                "application_process": "Through State Agriculture Departments",
-                "documents_required": ["Land Records", "Identity Proof", "Bank Account"],
-                "states": "All States",
-                "category": "Sustainable Agriculture",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Price Support Scheme (PSS)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Procurement at Minimum Support Price for various crops",
-                "benefit_amount": "MSP as declared by government annually",
-                "eligibility": "All farmers producing notified crops",
-                "application_process": "Through designated procurement centers",
-                "documents_required": ["Identity Proof", "Land Records", "Crop Quality Certificate"],
-                "states": "All States",
-                "category": "Price Support",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "Soil Health Card Scheme",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Free soil testing and health cards for farmers",
-                "benefit_amount": "Free soil testing (worth ₹190 per sample)",
-                "eligibility": "All farmers",
-                "application_process": "Through village level entrepreneurs or agriculture offices",
-                "documents_required": ["Land Records", "Identity Proof"],
-                "website": "https://soilhealth.dac.gov.in",
-                "states": "All States",
-                "category": "Soil Health",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            },
-            {
-                "scheme_name": "National Food Security Mission (NFSM)",
-                "ministry": "Ministry of Agriculture and Farmers Welfare",
-                "description": "Increase production of rice, wheat, pulses and coarse cereals",
-                "benefit_amount": "50% subsidy on seeds, 50% on equipment, 100% on demonstrations",
-                "eligibility": "Farmers in mission districts",
-                "application_process": "Through State Agriculture Departments",
-                "documents_required": ["Land Records", "Bank Account", "Identity Proof"],
-                "states": "Mission Districts in All States",
-                "category": "Production Enhancement",
-                "status": "Active",
-                "last_updated": "2024-10-18"
-            }
+            Scheme(
+                scheme_name="PM-KISAN Samman Nidhi",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Direct income support to landholding farmers families",
+                benefit_amount="₹6,000 per year in 3 installments",
+                eligibility="All landholding farmers families",
+                application_process="Online through PM-KISAN portal or CSC centers",
+                documents_required=("Aadhaar Card", "Bank Account Details", "Land Records"),
+                website="https://pmkisan.gov.in",
+                helpline="155261",
+                states="All States and UTs",
+                category="Direct Benefit Transfer",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Pradhan Mantri Fasal Bima Yojana (PMFBY)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Crop insurance scheme providing coverage against crop loss",
+                benefit_amount="Coverage up to sum insured amount",
+                eligibility="All farmers growing notified crops",
+                application_process="Through banks, CSC centers, or insurance companies",
+                documents_required=("Aadhaar Card", "Bank Account", "Land Records", "Sowing Certificate"),
+                website="https://pmfby.gov.in",
+                helpline="14447",
+                states="All States",
+                category="Crop Insurance",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Kisan Credit Card (KCC)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Credit facility for farmers for crop production and other needs",
+                benefit_amount="Credit limit based on land holding and cropping pattern",
+                eligibility="Farmers (individual/joint) who are owner cultivators",
+                application_process="Through participating banks",
+                documents_required=("Identity Proof", "Address Proof", "Land Documents"),
+                website="https://www.nabard.org/kcc.aspx",
+                helpline="1800-200-4291",
+                states="All States",
+                category="Credit Support",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Sub-Mission on Agricultural Mechanization (SMAM)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Financial assistance for purchase of agricultural machinery and equipment",
+                benefit_amount="25-50% subsidy on agricultural machinery",
+                eligibility="Individual farmers, SHGs, FPOs, Cooperatives",
+                application_process="Through State Agriculture Departments",
+                documents_required=("Identity Proof", "Bank Account", "Land Records"),
+                website="https://agrimachinery.nic.in",
+                states="All States",
+                category="Equipment Subsidy",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Paramparagat Krishi Vikas Yojana (PKVY)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Promotion of organic farming through cluster approach",
+                benefit_amount="₹50,000 per hectare over 3 years",
+                eligibility="Groups of farmers doing organic farming",
+                application_process="Through clusters formation and State Governments",
+                documents_required=("Group Formation Certificate", "Land Records"),
+                website="https://www.pkvy.gov.in",
+                states="All States",
+                category="Organic Farming",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="National Mission on Edible Oils - Oil Palm (NMEO-OP)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Assistance for oil palm cultivation",
+                benefit_amount="₹29,000 per hectare in first year",
+                eligibility="Farmers in suitable agro-climatic zones",
+                application_process="Through State implementing agencies",
+                documents_required=("Land Records", "Bank Account Details"),
+                states="Andhra Pradesh, Telangana, Karnataka, Tamil Nadu, Gujarat, Assam, Mizoram",
+                category="Crop Development",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="National Beekeeping and Honey Mission (NBHM)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Support for beekeeping and honey production",
+                benefit_amount="75% subsidy for SC/ST, 50% for others",
+                eligibility="Individual farmers, SHGs, FPOs",
+                application_process="Through State Horticulture Departments",
+                documents_required=("Identity Proof", "Category Certificate if applicable"),
+                states="All States",
+                category="Allied Agriculture",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Micro Irrigation Fund (MIF)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Support for micro irrigation systems",
+                benefit_amount="Up to 55% subsidy for micro irrigation",
+                eligibility="All categories of farmers",
+                application_process="Through State Agriculture/Horticulture Departments",
+                documents_required=("Land Records", "Bank Account", "Water Source Certificate"),
+                states="All States",
+                category="Irrigation Support",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Formation & Promotion of FPOs",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Support for formation of 10,000 Farmer Producer Organizations (FPOs)",
+                benefit_amount="₹15-33 lakh per FPO over 5 years",
+                eligibility="Groups of farmers, especially small and marginal",
+                application_process="Through Cluster Based Business Organizations (CBBOs)",
+                documents_required=("Group Formation Documents", "Business Plan", "Bank Account"),
+                website="https://www.sfacindia.com/fpo.aspx",
+                states="All States",
+                category="Institutional Support",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Interest Subvention Scheme",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Interest subvention on short term crop loans",
+                benefit_amount="4% interest rate (7% minus 3% subvention)",
+                eligibility="Farmers with KCC and crop loans up to ₹3 lakh",
+                application_process="Through banks issuing crop loans",
+                documents_required=("KCC", "Loan Application", "Crop Details"),
+                states="All States",
+                category="Credit Support",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="National Mission for Sustainable Agriculture (NMSA)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Promoting sustainable agriculture through climate resilient practices",
+                benefit_amount="Varies by component (50-100% for demos, 50% for equipment)",
+                eligibility="All farmers, with focus on climate vulnerable areas",
+                application_process="Through State Agriculture Departments",
+                documents_required=("Land Records", "Identity Proof", "Bank Account"),
+                states="All States",
+                category="Sustainable Agriculture",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Price Support Scheme (PSS)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Procurement at Minimum Support Price for various crops",
+                benefit_amount="MSP as declared by government annually",
+                eligibility="All farmers producing notified crops",
+                application_process="Through designated procurement centers",
+                documents_required=("Identity Proof", "Land Records", "Crop Quality Certificate"),
+                states="All States",
+                category="Price Support",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="Soil Health Card Scheme",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Free soil testing and health cards for farmers",
+                benefit_amount="Free soil testing (worth ₹190 per sample)",
+                eligibility="All farmers",
+                application_process="Through village level entrepreneurs or agriculture offices",
+                documents_required=("Land Records", "Identity Proof"),
+                website="https://soilhealth.dac.gov.in",
+                states="All States",
+                category="Soil Health",
+                status="Active",
+                last_updated="2024-10-18"
+            ),
+            Scheme(
+                scheme_name="National Food Security Mission (NFSM)",
+                ministry="Ministry of Agriculture and Farmers Welfare",
+                description="Increase production of rice, wheat, pulses and coarse cereals",
+                benefit_amount="50% subsidy on seeds, 50% on equipment, 100% on demonstrations",
+                eligibility="Farmers in mission districts",
+                application_process="Through State Agriculture Departments",
+                documents_required=("Land Records", "Bank Account", "Identity Proof"),
+                states="Mission Districts in All States",
+                category="Production Enhancement",
+                status="Active",
+                last_updated="2024-10-18"
+            )
         ]
 
     def setup_handlers(self):
@@ -466,95 +731,145 @@ class SubsidyMCPServer:
             )]
 
         # Format results with rich information
-        result_text = f"🌾 Found {len(search_results)} subsidies for '{query}':\n\n"
+        parts = [f"🌾 Found {len(search_results)} subsidies for '{query}':\n\n"]
         
         for i, scheme in enumerate(search_results, 1):
-            if isinstance(scheme, dict):
-                result_text += self.format_scheme_info(i, scheme)
-            else:
-                result_text += f"{i}. {scheme}\n\n"
+            parts.append(self.format_scheme_info(i, scheme))
             
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
 
-    def search_real_world_schemes(self, query: str, max_results: int) -> List[Dict]:
+    def search_real_world_schemes(self, query: str, max_results: int) -> List[Scheme]:
         """Search in real-world government schemes"""
-        query_lower = query.lower()
-        matching_schemes = []
-        
-        for scheme in self.real_world_schemes:
-            # Search in multiple fields
-            search_fields = [
-                scheme.get('scheme_name', ''),
-                scheme.get('description', ''),
-                scheme.get('category', ''),
-                scheme.get('states', ''),
-                ' '.join(scheme.get('documents_required', []))
-            ]
-            
-            search_text = ' '.join(search_fields).lower()
+        query_words = query.lower().split()
+        if not query_words:
+            return []
+        
+        cache_key = (' '.join(query_words), max_results)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            return list(cached)
+        
+        # Each distinct query word is tested once per field; a plain substring
+        # check per word, since words may overlap or nest inside each other
+        unique_words = set(query_words)
+        
+        def words_in(text: str) -> set:
+            return {word for word in unique_words if word in text}
+        
+        scores = np.zeros(len(self._scheme_blobs), dtype=np.int64)
+        
+        for i, search_text in enumerate(self._scheme_blobs):
+            matched = words_in(search_text)
+            if not matched:
+                continue
             
-            # Calculate relevance score
+            # Calculate relevance score, boosting matches in important fields
+            name_matched = words_in(self._scheme_name_lc[i])
+            category_matched = words_in(self._scheme_cat_lc[i])
             score = 0
-            query_words = query_lower.split()
-            
             for word in query_words:
-                if word in search_text:
-                    score += 1
-                    # Boost score for exact matches in important fields
-                    if word in scheme.get('scheme_name', '').lower():
-                        score += 2
-                    if word in scheme.get('category', '').lower():
-                        score += 1
-            
-            if score > 0:
-                scheme['relevance_score'] = score
-                matching_schemes.append(scheme)
-        
-        # Sort by relevance and return top results
-        matching_schemes.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        return matching_schemes[:max_results]
+                if word in matched:
+                    score += 1 + 2 * (word in name_matched) + (word in category_matched)
+            scores[i] = score
+        
+        # Select the top results without sorting every match. Ties are broken
+        # by list position, so earlier schemes rank first as with a stable sort.
+        k = min(max_results, int(np.count_nonzero(scores)))
+        if k > 0:
+            n = len(scores)
+            rank_keys = scores * n + (n - 1 - np.arange(n))
+            top = np.argpartition(-rank_keys, k - 1)[:k]
+            top = top[np.argsort(-rank_keys[top])]
+            results = [self.real_world_schemes[i] for i in top]
+        else:
+            results = []
+        self.admit_search_result(cache_key, results)
+        return results
 
-    def search_local_data(self, query: str, max_results: int) -> List:
+    def admit_search_result(self, cache_key: Tuple, results: List[Scheme]):
+        """Count a search query and cache its results once it repeats"""
+        now = time.time()
+        if now >= self._freq_decay_at:
+            self._query_freq = Counter({key: count // 2 for key, count in self._query_freq.items() if count > 1})
+            self._freq_decay_at = now + self.cache_duration
+        
+        self._query_freq[cache_key] += 1
+        if self._query_freq[cache_key] >= self._admit_threshold:
+            self._search_cache[cache_key] = tuple(results)
+            if len(self._search_cache) > self._search_cache_size:
+                self._search_cache.popitem(last=False)
+
+    def search_local_data(self, query: str, max_results: int) -> List[Scheme]:
         """Search in local CSV data"""
         if self.df.empty:
             return []
             
         query_lower = query.lower()
-        search_results = []
         
-        for _, row in self.df.iterrows():
-            row_text = " ".join([str(val).lower() for val in row.values if pd.notna(val)])
-            if query_lower in row_text:
-                search_results.append(row.to_dict())
-                
-        return search_results[:max_results]
+        if self._lf is not None:
+            # Case-insensitive substring match on each row's non-null values
+            # joined by spaces, as in _df_text, evaluated by Polars
+            row_text = pl.concat_str(pl.all().cast(pl.Utf8), separator=" ", ignore_nulls=True)
+            matches = self._lf.filter(
+                row_text.str.to_lowercase().str.contains(query_lower, literal=True)
+            ).head(max_results).collect()
+            return [Scheme.from_dict(row) for row in matches.to_dicts()]
+        
+        mask = self._df_text.str.contains(query_lower, regex=False)
+        return [
+            Scheme.from_dict(row.dropna().to_dict())
+            for _, row in self.df[mask].head(max_results).iterrows()
+        ]
 
-    def format_scheme_info(self, index: int, scheme: Dict) -> str:
+    def format_scheme_info(self, index: int, scheme: Scheme) -> str:
         """Format scheme information in a user-friendly way"""
-        formatted = f"{index}. 📋 {scheme.get('scheme_name', 'Unknown Scheme')}\n"
-        formatted += f"   🏛️  Ministry: {scheme.get('ministry', 'N/A')}\n"
-        formatted += f"   📝 Description: {scheme.get('description', 'N/A')}\n"
-        formatted += f"   💰 Benefit: {scheme.get('benefit_amount', 'N/A')}\n"
-        formatted += f"   ✅ Eligibility: {scheme.get('eligibility', 'N/A')}\n"
-        formatted += f"   🏷️  Category: {scheme.get('category', 'N/A')}\n"
-        formatted += f"   🌍 States: {scheme.get('states', 'N/A')}\n"
-        
-        if scheme.get('application_process'):
-            formatted += f"   📋 How to Apply: {scheme.get('application_process')}\n"
-        
-        if scheme.get('documents_required'):
-            docs = ', '.join(scheme.get('documents_required', []))
-            formatted += f"   📄 Documents: {docs}\n"
-        
-        if scheme.get('website'):
-            formatted += f"   🌐 Website: {scheme.get('website')}\n"
-            
-        if scheme.get('helpline'):
-            formatted += f"   📞 Helpline: {scheme.get('helpline')}\n"
+        return f"{index}. " + scheme.summary()
+
+    def start(self):
+        """Start background refresh of live data; call from inside the running event loop"""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._periodic_refresh())
+
+    async def shutdown(self):
+        """Stop background work started by start() and close the HTTP session"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # Configure SSL context for government APIs
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
             
-        formatted += f"   🕒 Last Updated: {scheme.get('last_updated', 'N/A')}\n\n"
-        
-        return formatted
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=50,
+                limit_per_host=10,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def _periodic_refresh(self):
+        """Refresh live schemes on a fixed TTL, independent of tool calls"""
+        while True:
+            await asyncio.sleep(self.cache_duration)
+            await self.fetch_and_cache_live_data()
 
     async def fetch_and_cache_live_data(self):
         """Fetch and cache live data from government sources"""
@@ -567,7 +882,7 @@ class SubsidyMCPServer:
         except Exception as e:
             self.logger.error(f"Failed to fetch live data: {e}")
 
-    async def fetch_live_government_schemes(self) -> List[Dict]:
+    async def fetch_live_government_schemes(self) -> List[Scheme]:
         """Fetch live schemes from various government sources including Data.gov"""
         all_schemes = []
         
@@ -585,89 +900,96 @@ class SubsidyMCPServer:
                 schemes = await source_func()
                 if schemes:
                     all_schemes.extend(schemes)
-                    self.logger.info(f"Fetched {len(schemes)} schemes from {source_func.__name__}")
+                    self.logger.info("Fetched %d schemes from %s", len(schemes), source_func.__name__)
             except Exception as e:
-                self.logger.warning(f"Failed to fetch from {source_func.__name__}: {e}")
+                self.logger.warning("Failed to fetch from %s: %s", source_func.__name__, e)
                 continue
         
         return all_schemes
 
-    async def fetch_data_gov_schemes(self) -> List[Dict]:
+    async def fetch_data_gov_schemes(self, max_results: int = 10) -> List[Scheme]:
         """Fetch agricultural schemes from Data.gov API"""
-        schemes = []
+        # Schemes deduplicated by lowercase name as they are collected, so
+        # max_results counts distinct schemes
+        unique_schemes: Dict[str, Scheme] = {}
+        
+        def collect(schemes: List[Scheme]):
+            for scheme in schemes:
+                name = scheme.scheme_name.lower()
+                if name:
+                    unique_schemes.setdefault(name, scheme)
         
         try:
-            # Configure SSL context for government APIs
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            session = await self._get_session()
             
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=15)
-            ) as session:
-                # Search for agricultural and subsidy related datasets
-                search_queries = [
-                    "agriculture subsidy",
-                    "farmer scheme", 
-                    "agricultural policy",
-                    "rural development",
-                    "crop insurance",
-                    "kisan credit"
-                ]
-                
-                for query in search_queries:
-                    try:
-                        # Search Data.gov catalog for relevant datasets
-                        search_url = self.api_endpoints['data_gov_search']
-                        params = {
-                            'q': query,
-                            'rows': 5,
-                            'start': 0
-                        }
-                        
-                        async with session.get(
-                            search_url, 
-                            params=params,
-                            headers=self.data_gov_headers
-                        ) as response:
-                            
-                            if response.status == 200:
-                                data = await response.json()
-                                
-                                if data.get('success') and data.get('result', {}).get('results'):
-                                    results = data['result']['results']
-                                    
-                                    for dataset in results[:2]:  # Limit to 2 per query
-                                        # Extract scheme information from dataset metadata
-                                        scheme_info = self.extract_scheme_from_dataset(dataset, query)
-                                        if scheme_info:
-                                            schemes.append(scheme_info)
-                                            
-                    except Exception as e:
-                        self.logger.warning(f"Error searching Data.gov for '{query}': {e}")
-                        continue
-                
-                # Also try to fetch specific agricultural data if available
-                await self.fetch_specific_agri_data(session, schemes)
+            # Search for agricultural and subsidy related datasets
+            search_queries = [
+                "agriculture subsidy",
+                "farmer scheme", 
+                "agricultural policy",
+                "rural development",
+                "crop insurance",
+                "kisan credit"
+            ]
+            
+            # Queries are independent, so run them concurrently; _dgov_sema
+            # keeps Data.gov from seeing more than 4 requests at once
+            results = await asyncio.gather(
+                *(self._search_one(session, query) for query in search_queries),
+                return_exceptions=True
+            )
+            for query_schemes in results:
+                if len(unique_schemes) >= max_results:
+                    break
+                if isinstance(query_schemes, list):
+                    collect(query_schemes)
+            
+            # Also try to fetch specific agricultural data if available
+            if len(unique_schemes) < max_results:
+                agri_schemes = []
+                await self.fetch_specific_agri_data(session, agri_schemes)
+                collect(agri_schemes)
                 
         except Exception as e:
             self.logger.error(f"Error fetching Data.gov schemes: {e}")
         
-        # Remove duplicates based on scheme name
-        unique_schemes = []
-        seen_names = set()
-        for scheme in schemes:
-            name = scheme.get('scheme_name', '').lower()
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_schemes.append(scheme)
+        return list(unique_schemes.values())[:max_results]
+
+    async def _search_one(self, session: aiohttp.ClientSession, query: str) -> List[Scheme]:
+        """Search the Data.gov catalog for one query"""
+        schemes = []
         
-        return unique_schemes[:10]  # Limit to 10 schemes from Data.gov
+        try:
+            # Only the first 2 rows and the fields we extract are requested
+            search_url = self.api_endpoints['data_gov_search']
+            params = {
+                'q': query,
+                'rows': 2,
+                'start': 0,
+                'fl': ','.join(_DATASET_FIELDS)
+            }
+            
+            data = await self._cached_get_json(
+                session,
+                search_url,
+                params,
+                self.search_cache_ttl,
+                timeout=_DATA_GOV_TIMEOUT
+            )
+            
+            if data and data.get('success') and data.get('result', {}).get('results'):
+                for dataset in data['result']['results']:
+                    # Extract scheme information from dataset metadata
+                    scheme_info = self.extract_scheme_from_dataset(dataset, query)
+                    if scheme_info:
+                        schemes.append(scheme_info)
+                                    
+        except Exception as e:
+            self.logger.warning("Error searching Data.gov for '%s': %s", query, e)
+        
+        return schemes
 
-    async def fetch_specific_agri_data(self, session: aiohttp.ClientSession, schemes: List[Dict]):
+    async def fetch_specific_agri_data(self, session: aiohttp.ClientSession, schemes: List[Scheme]):
         """Fetch specific agricultural data from known Data.gov datasets"""
         try:
             # Try to fetch from known agricultural datasets
@@ -677,179 +999,181 @@ class SubsidyMCPServer:
                 'agricultural-subsidies'
             ]
             
-            for dataset_id in known_datasets:
-                try:
-                    # Try to get dataset details
-                    dataset_url = f"{self.api_endpoints['data_gov_base']}/package_show"
-                    params = {'id': dataset_id}
-                    
-                    async with session.get(
-                        dataset_url,
-                        params=params,
-                        headers=self.data_gov_headers
-                    ) as response:
-                        
-                        if response.status == 200:
-                            data = await response.json()
-                            if data.get('success') and data.get('result'):
-                                dataset_info = data['result']
-                                scheme_info = self.extract_scheme_from_dataset(dataset_info, 'agricultural_data')
-                                if scheme_info:
-                                    schemes.append(scheme_info)
-                                    
-                except Exception as e:
-                    self.logger.debug(f"Dataset {dataset_id} not found or accessible: {e}")
-                    continue
+            results = await asyncio.gather(
+                *(self._fetch_dataset(session, dataset_id) for dataset_id in known_datasets),
+                return_exceptions=True
+            )
+            for scheme_info in results:
+                if isinstance(scheme_info, Scheme):
+                    schemes.append(scheme_info)
                     
         except Exception as e:
             self.logger.warning(f"Error fetching specific agricultural data: {e}")
 
-    def extract_scheme_from_dataset(self, dataset: Dict, search_query: str) -> Dict:
+    async def _fetch_dataset(self, session: aiohttp.ClientSession, dataset_id: str) -> Optional[Scheme]:
+        """Fetch one known Data.gov dataset and extract a scheme from it"""
+        try:
+            # Try to get dataset details
+            dataset_url = f"{self.api_endpoints['data_gov_base']}/package_show"
+            params = {'id': dataset_id}
+            
+            data = await self._cached_get_json(
+                session,
+                dataset_url,
+                params,
+                self.dataset_cache_ttl,
+                result_fields=_DATASET_FIELDS,
+                timeout=_DATA_GOV_TIMEOUT
+            )
+            
+            if data and data.get('success') and data.get('result'):
+                return self.extract_scheme_from_dataset(data['result'], 'agricultural_data')
+                            
+        except Exception as e:
+            self.logger.debug("Dataset %s not found or accessible: %s", dataset_id, e)
+        
+        return None
+
+    async def _cached_get_json(self, session: aiohttp.ClientSession, url: str, params: Dict,
+                               ttl: float, result_fields: Optional[Tuple[str, ...]] = None,
+                               **kwargs) -> Optional[Dict]:
+        """GET a Data.gov JSON document, serving it from cache while fresh.
+
+        Stale entries are revalidated with If-None-Match/If-Modified-Since, so
+        an unchanged document costs a body-less 304 instead of a full download.
+        Returns None for any other non-200 response.
+
+        For endpoints without CKAN's fl= selection, result_fields names the
+        keys of 'result' to keep; with ijson installed the body is streamed
+        and only those keys are kept, instead of loading every resource.
+        """
+        cache_key = (url, frozenset(params.items()))
+        cached = self.cache.get(cache_key)
+        current_time = time.time()
+        
+        if cached is not None:
+            data, timestamp, etag, last_modified = cached
+            if current_time - timestamp < ttl:
+                return data
+        
+        headers = dict(self.data_gov_headers)
+        if cached is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        async with self._dgov_sema, session.get(url, params=params, headers=headers, **kwargs) as response:
+            if response.status == 304 and cached is not None:
+                self.cache[cache_key] = (data, current_time, etag, last_modified)
+                return data
+            if response.status != 200:
+                return None
+            
+            if result_fields and IJSON_AVAILABLE:
+                result = {}
+                async for key, value in ijson.kvitems(response.content, 'result'):
+                    if key in result_fields:
+                        result[key] = value
+                data = {'success': bool(result), 'result': result}
+            else:
+                data = await response.json()
+            self.cache[cache_key] = (
+                data,
+                current_time,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+            return data
+
+    def extract_scheme_from_dataset(self, dataset: Dict, search_query: str) -> Optional[Scheme]:
         """Extract scheme information from Data.gov dataset metadata"""
         try:
             title = dataset.get('title', '')
-            description = dataset.get('notes', '') or dataset.get('description', '')
+            description = dataset.get('notes') or dataset.get('description') or ''
             organization = dataset.get('organization', {})
             org_name = organization.get('title', '') if isinstance(organization, dict) else str(organization)
+            # Only fall back to the current time when the dataset has no timestamp
+            modified = dataset['metadata_modified'] if 'metadata_modified' in dataset else datetime.now().isoformat()
             
             # Create scheme information from dataset metadata
-            scheme = {
-                "scheme_name": f"Data.gov: {title[:60]}..." if len(title) > 60 else f"Data.gov: {title}",
-                "ministry": org_name or "Government of India",
-                "description": description[:200] + "..." if len(description) > 200 else description,
-                "benefit_amount": "Varies - see dataset for details",
-                "eligibility": "As per dataset specifications",
-                "application_process": "Refer to dataset documentation and implementing agency",
-                "documents_required": ["As specified in dataset documentation"],
-                "website": dataset.get('url', 'https://catalog.data.gov'),
-                "states": "As per dataset coverage",
-                "category": self.categorize_from_query(search_query),
-                "status": "Active" if dataset.get('state') == 'active' else "Check Status",
-                "data_source": "data_gov_api",
-                "data_freshness": "live",
-                "last_updated": dataset.get('metadata_modified', datetime.now().isoformat())[:10],
-                "dataset_id": dataset.get('id', ''),
-                "search_relevance": search_query
-            }
+            scheme = Scheme(
+                scheme_name="Data.gov: " + _truncate(title, 60),
+                ministry=org_name or "Government of India",
+                description=_truncate(description, 200),
+                benefit_amount="Varies - see dataset for details",
+                eligibility="As per dataset specifications",
+                application_process="Refer to dataset documentation and implementing agency",
+                documents_required=("As specified in dataset documentation",),
+                website=dataset.get('url', 'https://catalog.data.gov'),
+                states="As per dataset coverage",
+                category=self.categorize_from_query(search_query),
+                status="Active" if dataset.get('state') == 'active' else "Check Status",
+                data_source="data_gov_api",
+                data_freshness="live",
+                last_updated=modified[:10],
+                dataset_id=dataset.get('id', ''),
+                search_relevance=search_query
+            )
             
             return scheme
             
         except Exception as e:
-            self.logger.warning(f"Error extracting scheme from dataset: {e}")
+            self.logger.warning("Error extracting scheme from dataset: %s", e)
             return None
 
     def categorize_from_query(self, search_query: str) -> str:
         """Categorize scheme based on search query"""
         query_lower = search_query.lower()
-        
-        if 'insurance' in query_lower:
-            return "Crop Insurance"
-        elif 'credit' in query_lower or 'loan' in query_lower:
-            return "Credit Support"
-        elif 'subsidy' in query_lower:
-            return "Government Subsidy"
-        elif 'rural' in query_lower:
-            return "Rural Development"
-        elif 'crop' in query_lower or 'agriculture' in query_lower:
-            return "Agricultural Support"
-        else:
-            return "Government Scheme"
+        return next(
+            (category for keyword, category in _CATEGORY_RULES if keyword in query_lower),
+            "Government Scheme"
+        )
 
-    async def fetch_pmkisan_schemes(self) -> List[Dict]:
+    async def fetch_pmkisan_schemes(self) -> List[Scheme]:
         """Fetch schemes from PM-KISAN and related portals"""
         schemes = []
         
         try:
-            # Configure SSL context for government APIs
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            # Try to get PM-KISAN data (most sites don't have public APIs)
+            # This is a mock implementation - in reality, most government sites
+            # don't provide public APIs and would require web scraping
             
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                # Try to get PM-KISAN data (most sites don't have public APIs)
-                # This is a mock implementation - in reality, most government sites
-                # don't provide public APIs and would require web scraping
-                
-                # For now, we'll enhance our hardcoded data with live status checks
-                schemes.append({
-                    "scheme_name": "PM-KISAN Status Check",
-                    "ministry": "Ministry of Agriculture and Farmers Welfare",
-                    "description": "Live status check for PM-KISAN scheme",
-                    "benefit_amount": "₹6,000 per year",
-                    "eligibility": "Landholding farmers",
-                    "application_process": "Online portal",
-                    "website": "https://pmkisan.gov.in",
-                    "status": "Active",
-                    "data_source": "live_check",
-                    "last_updated": datetime.now().isoformat()
-                })
+            # For now, we'll enhance our hardcoded data with live status checks
+            schemes.append(replace(_PMKISAN_TEMPLATE, last_updated=datetime.now().isoformat()))
                 
         except Exception as e:
             self.logger.error(f"Error fetching PM-KISAN schemes: {e}")
         
         return schemes
 
-    async def fetch_digital_india_schemes(self) -> List[Dict]:
+    async def fetch_digital_india_schemes(self) -> List[Scheme]:
         """Fetch schemes from Digital India portal"""
         schemes = []
         
         try:
             # Add a Digital India scheme based on real initiatives
-            schemes.append({
-                "scheme_name": "Digital Agriculture Mission",
-                "ministry": "Ministry of Electronics & Information Technology",
-                "description": "Digital transformation of agriculture through technology adoption",
-                "benefit_amount": "Technology infrastructure support",
-                "eligibility": "Farmers, FPOs, and agricultural cooperatives",
-                "application_process": "Online through Digital India portal",
-                "website": "https://digitalindia.gov.in",
-                "category": "Digital Agriculture",
-                "status": "Active",
-                "data_source": "digital_india_portal",
-                "last_updated": datetime.now().isoformat()
-            })
+            schemes.append(replace(_DIGITAL_INDIA_TEMPLATE, last_updated=datetime.now().isoformat()))
                             
         except Exception as e:
             self.logger.error(f"Error fetching Digital India schemes: {e}")
         
         return schemes
 
-    async def fetch_mygov_schemes(self) -> List[Dict]:
+    async def fetch_mygov_schemes(self) -> List[Scheme]:
         """Fetch schemes from MyGov portal"""
         schemes = []
         
         try:
             # Add MyGov citizen engagement schemes
-            mygov_schemes = [
-                {
-                    "scheme_name": "MyGov Farmer Connect Initiative",
-                    "ministry": "Ministry of Agriculture and Farmers Welfare",
-                    "description": "Digital platform for farmer engagement and feedback on government policies",
-                    "benefit_amount": "Free digital services and policy participation",
-                    "eligibility": "All farmers and citizens interested in agriculture",
-                    "application_process": "Registration on MyGov platform",
-                    "documents_required": ["Mobile number", "Email ID"],
-                    "website": "https://www.mygov.in",
-                    "category": "Digital Engagement",
-                    "status": "Active",
-                    "data_source": "mygov_portal",
-                    "last_updated": datetime.now().isoformat()
-                }
-            ]
-            
-            schemes.extend(mygov_schemes)
+            schemes.append(replace(_MYGOV_TEMPLATE, last_updated=datetime.now().isoformat()))
                 
         except Exception as e:
             self.logger.error(f"Error fetching MyGov schemes: {e}")
         
         return schemes
 
-    async def scrape_agri_dept_schemes(self) -> List[Dict]:
+    async def scrape_agri_dept_schemes(self) -> List[Scheme]:
         """Scrape schemes from Agriculture Department websites"""
         schemes = []
         
@@ -857,35 +1181,10 @@ class SubsidyMCPServer:
             # This would involve web scraping of government sites
             # For production, you'd use libraries like BeautifulSoup or Selenium
             # Here's a mock implementation with state-specific schemes
+            now_iso = datetime.now().isoformat()
             
             state_schemes = [
-                {
-                    "scheme_name": "Karnataka Raitha Shakti Scheme",
-                    "ministry": "Government of Karnataka",
-                    "description": "Interest-free loans for farmers in Karnataka",
-                    "benefit_amount": "Up to ₹3 lakh interest-free loan",
-                    "eligibility": "Small and marginal farmers in Karnataka",
-                    "application_process": "Through cooperative banks and PACS",
-                    "documents_required": ["Aadhaar", "Land Records", "Income Certificate"],
-                    "states": "Karnataka",
-                    "category": "State Credit Support",
-                    "status": "Active",
-                    "data_source": "state_government",
-                    "last_updated": datetime.now().isoformat()
-                },
-                {
-                    "scheme_name": "Tamil Nadu Uzhavar Sandhai",
-                    "ministry": "Government of Tamil Nadu",
-                    "description": "Direct marketing platform for farmers",
-                    "benefit_amount": "No commission fees for farmers",
-                    "eligibility": "All farmers in Tamil Nadu",
-                    "application_process": "Registration at Uzhavar Sandhai centers",
-                    "states": "Tamil Nadu",
-                    "category": "Marketing Support",
-                    "status": "Active",
-                    "data_source": "state_government",
-                    "last_updated": datetime.now().isoformat()
-                }
+                replace(template, last_updated=now_iso) for template in _STATE_SCHEME_TEMPLATES
             ]
             
             schemes.extend(state_schemes)
@@ -895,26 +1194,37 @@ class SubsidyMCPServer:
         
         return schemes
 
-    def merge_live_schemes(self, live_schemes: List[Dict]):
+    def merge_live_schemes(self, live_schemes: List[Scheme]):
         """Merge live schemes with existing hardcoded schemes"""
-        # Create a set of existing scheme names for comparison
-        existing_names = {scheme.get('scheme_name', '').lower() for scheme in self.real_world_schemes}
+        # Build the merged list separately and swap it in at the end, so
+        # tool handlers only ever see a complete snapshot
+        merged = list(self.real_world_schemes)
+        
+        # Map each existing scheme name to its position for O(1) lookups
+        index_by_name = {}
+        for i, scheme in enumerate(merged):
+            index_by_name.setdefault(scheme.scheme_name.lower(), i)
         
         # Add new live schemes that don't exist in hardcoded data
         for live_scheme in live_schemes:
-            scheme_name = live_scheme.get('scheme_name', '').lower()
-            if scheme_name not in existing_names:
-                live_scheme['data_freshness'] = 'live'
-                self.real_world_schemes.append(live_scheme)
+            scheme_name = live_scheme.scheme_name.lower()
+            i = index_by_name.get(scheme_name)
+            if i is None:
+                index_by_name[scheme_name] = len(merged)
+                merged.append(replace(live_scheme, data_freshness='live'))
             else:
-                # Update existing scheme with live data where appropriate
-                for existing_scheme in self.real_world_schemes:
-                    if existing_scheme.get('scheme_name', '').lower() == scheme_name:
-                        # Update status and last_updated from live data
-                        existing_scheme['status'] = live_scheme.get('status', existing_scheme.get('status'))
-                        existing_scheme['last_updated'] = live_scheme.get('last_updated', existing_scheme.get('last_updated'))
-                        existing_scheme['data_freshness'] = 'updated'
-                        break
+                # Update existing scheme's status and last_updated from live data
+                existing_scheme = merged[i]
+                merged[i] = replace(
+                    existing_scheme,
+                    status=live_scheme.status or existing_scheme.status,
+                    last_updated=live_scheme.last_updated or existing_scheme.last_updated,
+                    data_freshness='updated'
+                )
+        
+        self.real_world_schemes = merged
+        self._rebuild_indices()
+        self._search_cache.clear()
 
     async def fetch_live_scheme_updates(self) -> Dict:
         """Fetch live updates summary from government APIs"""
@@ -929,55 +1239,24 @@ class SubsidyMCPServer:
         
         # Get live status information
         live_data = {
-            "schemes_active": len([s for s in self.real_world_schemes if s.get('status') == 'Active']),
-            "schemes_with_live_data": len([s for s in self.real_world_schemes if s.get('data_freshness') in ['live', 'updated']]),
+            "schemes_active": self._active_count,
+            "schemes_with_live_data": self._live_count,
             "last_checked": datetime.now().isoformat(),
-            "data_sources": ["Data.gov API", "PM-KISAN Portal", "Digital India", "MyGov", "State Governments"],
+            "data_sources": _DATA_SOURCES,
             "notification": "Data includes both verified government schemes and live updates where available"
         }
         
         # Try to get real-time status from key portals and APIs
         try:
-            # Configure SSL context for government APIs
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            session = await self._get_session()
             
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                # Check Data.gov API status
-                try:
-                    test_url = self.api_endpoints['data_gov_search']
-                    params = {'q': 'test', 'rows': 1}
-                    async with session.get(
-                        test_url, 
-                        params=params,
-                        headers=self.data_gov_headers,
-                        timeout=8
-                    ) as response:
-                        if response.status == 200:
-                            live_data['data_gov_api_status'] = 'online'
-                            live_data['data_gov_last_check'] = datetime.now().isoformat()
-                        else:
-                            live_data['data_gov_api_status'] = f'error_{response.status}'
-                except Exception as e:
-                    live_data['data_gov_api_status'] = 'unavailable'
-                    self.logger.warning(f"Data.gov API check failed: {e}")
+            # Both portal checks are independent, so run them concurrently
+            for status in await asyncio.gather(
+                self._check_data_gov(session),
+                self._check_pmkisan(session)
+            ):
+                live_data.update(status)
                 
-                # Check PM-KISAN portal availability (basic health check)
-                try:
-                    async with session.get('https://pmkisan.gov.in', timeout=5) as response:
-                        if response.status == 200:
-                            live_data['pmkisan_status'] = 'online'
-                        else:
-                            live_data['pmkisan_status'] = 'unavailable'
-                except:
-                    live_data['pmkisan_status'] = 'unavailable'
-                    
         except Exception as e:
             self.logger.error(f"Error checking portal status: {e}")
             live_data['portal_check'] = 'failed'
@@ -986,69 +1265,93 @@ class SubsidyMCPServer:
         self.cache[cache_key] = (live_data, current_time)
         return live_data
 
+    async def _check_data_gov(self, session: aiohttp.ClientSession) -> Dict:
+        """Check Data.gov API status"""
+        try:
+            test_url = self.api_endpoints['data_gov_search']
+            params = {'q': 'test', 'rows': 1}
+            async with self._dgov_sema, session.get(
+                test_url, 
+                params=params,
+                headers=self.data_gov_headers,
+                timeout=8
+            ) as response:
+                if response.status == 200:
+                    return {
+                        'data_gov_api_status': 'online',
+                        'data_gov_last_check': datetime.now().isoformat()
+                    }
+                return {'data_gov_api_status': f'error_{response.status}'}
+        except Exception as e:
+            self.logger.warning(f"Data.gov API check failed: {e}")
+            return {'data_gov_api_status': 'unavailable'}
+
+    async def _check_pmkisan(self, session: aiohttp.ClientSession) -> Dict:
+        """Check PM-KISAN portal availability (basic health check)"""
+        try:
+            async with self._pmkisan_sema, session.get('https://pmkisan.gov.in', timeout=5) as response:
+                return {'pmkisan_status': 'online' if response.status == 200 else 'unavailable'}
+        except Exception:
+            return {'pmkisan_status': 'unavailable'}
+
     async def get_categories(self, arguments: dict = None) -> list[TextContent]:
         """Get available subsidy categories"""
         # Extract categories from real-world schemes
-        categories = {}
-        
-        for scheme in self.real_world_schemes:
-            category = scheme.get('category', 'General')
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
+        categories = {category: len(schemes) for category, schemes in self._by_category.items()}
         
         # Also check local data if available
         if not self.df.empty:
-            for col in self.df.columns:
-                if 'category' in col.lower() or 'type' in col.lower():
-                    unique_values = self.df[col].dropna().unique()
-                    for cat in unique_values:
-                        cat_name = f"{cat} (Local Data)"
-                        if cat_name not in categories:
-                            categories[cat_name] = 0
-                        categories[cat_name] += 1
+            # Each distinct value counts once per category/type column
+            category_cols = self.df.filter(regex='(?i)category|type')
+            if not category_cols.empty:
+                local_values = pd.concat(
+                    [category_cols[col].dropna().drop_duplicates() for col in category_cols.columns]
+                )
+                for cat, count in local_values.value_counts(sort=False).items():
+                    cat_name = f"{cat} (Local Data)"
+                    categories[cat_name] = categories.get(cat_name, 0) + count
         
         if not categories:
             categories = {"General Subsidies": 1}
         
-        result_text = "🏷️ Available Subsidy Categories:\n\n"
+        parts = ["🏷️ Available Subsidy Categories:\n\n"]
         
         # Sort by number of schemes in each category
         sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
         
         for i, (category, count) in enumerate(sorted_categories, 1):
-            result_text += f"{i}. **{category}** ({count} scheme{'s' if count != 1 else ''})\n"
+            parts.append(f"{i}. **{category}** ({count} scheme{'s' if count != 1 else ''})\n")
         
-        result_text += "\n💡 Use 'search_by_category' tool with any category name to find specific schemes.\n"
-        result_text += "💡 Use 'subsidy_search' tool with keywords related to your farming needs.\n"
+        parts.append("\n💡 Use 'search_by_category' tool with any category name to find specific schemes.\n")
+        parts.append("💡 Use 'subsidy_search' tool with keywords related to your farming needs.\n")
         
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     async def get_subsidies_by_state(self, arguments: dict) -> list[TextContent]:
         """Get subsidies filtered by state"""
         state = arguments.get("state", "")
         state_lower = state.lower()
         
-        # Search in real-world schemes first
-        state_schemes = []
-        
-        for scheme in self.real_world_schemes:
-            states_field = scheme.get('states', '').lower()
-            if state_lower in states_field or 'all states' in states_field:
-                state_schemes.append(scheme)
+        # Search in real-world schemes first, testing each distinct states
+        # field once; an empty state matches every scheme
+        if state_lower:
+            matches = [i for key, positions in self._by_state_lower.items()
+                       if state_lower in key for i in positions]
+        else:
+            matches = range(len(self.real_world_schemes))
+        positions = set(matches).union(self._all_states)
+        state_schemes = [self.real_world_schemes[i] for i in sorted(positions)]
         
         # Also search in local data if available
         if not self.df.empty:
-            for _, row in self.df.iterrows():
-                row_text = " ".join([str(val).lower() for val in row.values if pd.notna(val)])
-                if state_lower in row_text:
-                    # Convert row to dict format
-                    scheme_dict = {
-                        'scheme_name': str(row.get('scheme_name', 'Unknown')),
-                        'description': str(row.get('description', 'N/A')),
-                        'data_source': 'local_csv'
-                    }
-                    state_schemes.append(scheme_dict)
+            mask = self._df_text.str.contains(state_lower, regex=False)
+            for _, row in self.df[mask].iterrows():
+                # Convert row to a scheme record
+                state_schemes.append(Scheme(
+                    scheme_name=str(row.get('scheme_name', 'Unknown')),
+                    description=str(row.get('description', 'N/A')),
+                    data_source='local_csv'
+                ))
         
         if not state_schemes:
             return [TextContent(
@@ -1056,50 +1359,47 @@ class SubsidyMCPServer:
                 text=f"No subsidies found for state: '{state}'. Try 'All States' or check scheme availability in your region."
             )]
             
-        result_text = f"🌾 Found {len(state_schemes)} subsidies available in {state}:\n\n"
+        parts = [f"🌾 Found {len(state_schemes)} subsidies available in {state}:\n\n"]
         
         for i, scheme in enumerate(state_schemes[:10], 1):  # Limit to 10 results
-            if isinstance(scheme, dict):
-                result_text += self.format_scheme_info(i, scheme)
-            else:
-                result_text += f"{i}. {scheme}\n\n"
+            parts.append(self.format_scheme_info(i, scheme))
         
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     async def get_live_status(self, arguments: dict = None) -> list[TextContent]:
         """Get live status updates for government schemes"""
         try:
             live_data = await self.fetch_live_scheme_updates()
             
-            result_text = "🔄 Live Government Schemes Status:\n\n"
-            result_text += f"📊 Active Schemes: {live_data.get('schemes_active', 0)}\n"
-            result_text += f"🔄 Schemes with Live Data: {live_data.get('schemes_with_live_data', 0)}\n"
-            result_text += f"🕒 Last Checked: {live_data.get('last_checked', 'N/A')}\n"
+            parts = ["🔄 Live Government Schemes Status:\n\n"]
+            parts.append(f"📊 Active Schemes: {live_data.get('schemes_active', 0)}\n")
+            parts.append(f"🔄 Schemes with Live Data: {live_data.get('schemes_with_live_data', 0)}\n")
+            parts.append(f"🕒 Last Checked: {live_data.get('last_checked', 'N/A')}\n")
             
             if 'data_sources' in live_data:
                 sources = ', '.join(live_data['data_sources'])
-                result_text += f"📡 Data Sources: {sources}\n"
+                parts.append(f"📡 Data Sources: {sources}\n")
             
             # Show API status
             if 'data_gov_api_status' in live_data:
                 api_status_icon = "🟢" if live_data['data_gov_api_status'] == 'online' else "🔴"
-                result_text += f"{api_status_icon} Data.gov API: {live_data['data_gov_api_status']}\n"
+                parts.append(f"{api_status_icon} Data.gov API: {live_data['data_gov_api_status']}\n")
                 
             if 'pmkisan_status' in live_data:
                 status_icon = "🟢" if live_data['pmkisan_status'] == 'online' else "🔴"
-                result_text += f"{status_icon} PM-KISAN Portal: {live_data['pmkisan_status']}\n"
+                parts.append(f"{status_icon} PM-KISAN Portal: {live_data['pmkisan_status']}\n")
             
             if 'notification' in live_data:
-                result_text += f"\n📢 Notice: {live_data['notification']}\n"
+                parts.append(f"\n📢 Notice: {live_data['notification']}\n")
             
             # Add scheme freshness info
-            fresh_schemes = [s for s in self.real_world_schemes if s.get('data_freshness') == 'live']
+            fresh_schemes = self._fresh_schemes
             if fresh_schemes:
-                result_text += f"\n🆕 Recently Updated Schemes:\n"
+                parts.append(f"\n🆕 Recently Updated Schemes:\n")
                 for scheme in fresh_schemes[:3]:
-                    result_text += f"• {scheme.get('scheme_name', 'Unknown')}\n"
+                    parts.append(f"• {scheme.scheme_name or 'Unknown'}\n")
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(
@@ -1113,16 +1413,14 @@ class SubsidyMCPServer:
         max_results = arguments.get("max_results", 5)
         
         category_lower = category.lower()
-        matching_schemes = []
-        
-        for scheme in self.real_world_schemes:
-            scheme_category = scheme.get('category', '').lower()
-            if category_lower in scheme_category:
-                matching_schemes.append(scheme)
+        matching_schemes = [
+            scheme for scheme, scheme_category in zip(self.real_world_schemes, self._scheme_cat_lc)
+            if category_lower in scheme_category
+        ]
         
         if not matching_schemes:
             # Get available categories for suggestion
-            categories = list(set([s.get('category', 'N/A') for s in self.real_world_schemes]))
+            categories = list(set([s.category or 'N/A' for s in self.real_world_schemes]))
             available_cats = ', '.join(categories[:5])
             
             return [TextContent(
@@ -1130,12 +1428,12 @@ class SubsidyMCPServer:
                 text=f"No schemes found for category '{category}'. Available categories include: {available_cats}"
             )]
         
-        result_text = f"🏷️ Found {len(matching_schemes)} schemes in category '{category}':\n\n"
+        parts = [f"🏷️ Found {len(matching_schemes)} schemes in category '{category}':\n\n"]
         
         for i, scheme in enumerate(matching_schemes[:max_results], 1):
-            result_text += self.format_scheme_info(i, scheme)
+            parts.append(self.format_scheme_info(i, scheme))
         
-        return [TextContent(type="text", text=result_text)]
+        return [TextContent(type="text", text="".join(parts))]
 
     async def get_scheme_details(self, arguments: dict) -> list[TextContent]:
         """Get detailed information about a specific scheme"""
@@ -1143,11 +1441,11 @@ class SubsidyMCPServer:
         scheme_name_lower = scheme_name.lower()
         
         # Find the scheme
-        found_scheme = None
-        for scheme in self.real_world_schemes:
-            if scheme_name_lower in scheme.get('scheme_name', '').lower():
-                found_scheme = scheme
-                break
+        found_scheme = next(
+            (scheme for scheme, name_lc in zip(self.real_world_schemes, self._scheme_name_lc)
+             if scheme_name_lower in name_lc),
+            None
+        )
         
         if not found_scheme:
             return [TextContent(
@@ -1156,44 +1454,44 @@ class SubsidyMCPServer:
             )]
         
         # Format detailed information
-        result_text = f"📋 Detailed Information: {found_scheme.get('scheme_name', 'Unknown')}\n\n"
+        parts = [f"📋 Detailed Information: {found_scheme.scheme_name or 'Unknown'}\n\n"]
         
         details = [
-            ("🏛️ Ministry", found_scheme.get('ministry', 'N/A')),
-            ("📝 Description", found_scheme.get('description', 'N/A')),
-            ("💰 Benefit Amount", found_scheme.get('benefit_amount', 'N/A')),
-            ("✅ Eligibility", found_scheme.get('eligibility', 'N/A')),
-            ("📋 Application Process", found_scheme.get('application_process', 'N/A')),
-            ("🏷️ Category", found_scheme.get('category', 'N/A')),
-            ("🌍 States/Coverage", found_scheme.get('states', 'N/A')),
-            ("📄 Required Documents", ', '.join(found_scheme.get('documents_required', []))),
-            ("🌐 Official Website", found_scheme.get('website', 'N/A')),
-            ("📞 Helpline", found_scheme.get('helpline', 'N/A')),
-            ("🔄 Status", found_scheme.get('status', 'N/A')),
-            ("🕒 Last Updated", found_scheme.get('last_updated', 'N/A'))
+            ("🏛️ Ministry", found_scheme.ministry),
+            ("📝 Description", found_scheme.description),
+            ("💰 Benefit Amount", found_scheme.benefit_amount),
+            ("✅ Eligibility", found_scheme.eligibility),
+            ("📋 Application Process", found_scheme.application_process),
+            ("🏷️ Category", found_scheme.category),
+            ("🌍 States/Coverage", found_scheme.states),
+            ("📄 Required Documents", ', '.join(found_scheme.documents_required)),
+            ("🌐 Official Website", found_scheme.website),
+            ("📞 Helpline", found_scheme.helpline),
+            ("🔄 Status", found_scheme.status),
+            ("🕒 Last Updated", found_scheme.last_updated)
         ]
         
         for label, value in details:
             if value and value != 'N/A':
-                result_text += f"{label}: {value}\n"
+                parts.append(f"{label}: {value}\n")
         
         # Add data source info
-        if found_scheme.get('data_source'):
-            result_text += f"\n📡 Data Source: {found_scheme.get('data_source')}\n"
+        if found_scheme.data_source:
+            parts.append(f"\n📡 Data Source: {found_scheme.data_source}\n")
         
-        if found_scheme.get('data_freshness'):
-            freshness_icon = "🆕" if found_scheme.get('data_freshness') == 'live' else "🔄"
-            result_text += f"{freshness_icon} Data Freshness: {found_scheme.get('data_freshness')}\n"
+        if found_scheme.data_freshness:
+            freshness_icon = "🆕" if found_scheme.data_freshness == 'live' else "🔄"
+            parts.append(f"{freshness_icon} Data Freshness: {found_scheme.data_freshness}\n")
         
         # Add application tips
-        result_text += "\n💡 Application Tips:\n"
-        result_text += "• Keep all required documents ready before applying\n"
-        result_text += "• Check eligibility criteria carefully\n"
-        result_text += "• Apply through official channels only\n"
-        if found_scheme.get('helpline'):
-            result_text += f"• Contact helpline {found_scheme.get('helpline')} for assistance\n"
-        
-        return [TextContent(type="text", text=result_text)]
+        parts.append("\n💡 Application Tips:\n")
+        parts.append("• Keep all required documents ready before applying\n")
+        parts.append("• Check eligibility criteria carefully\n")
+        parts.append("• Apply through official channels only\n")
+        if found_scheme.helpline:
+            parts.append(f"• Contact helpline {found_scheme.helpline} for assistance\n")
+        
+        return [TextContent(type="text", text="".join(parts))]
 
     async def fetch_live_data_gov_schemes_tool(self, arguments: dict) -> list[TextContent]:
         """Tool to fetch live schemes from Data.gov API with custom search"""
@@ -1201,8 +1499,6 @@ class SubsidyMCPServer:
         max_results = arguments.get("max_results", 5)
         
         try:
-            result_text = f"🔄 Fetching live data from Data.gov API for '{search_query}'...\n\n"
-            
             # Fetch live schemes from Data.gov
             live_schemes = await self.fetch_data_gov_schemes()
             
@@ -1214,18 +1510,27 @@ class SubsidyMCPServer:
             
             # Filter results based on search query if needed
             if search_query.lower() != "agriculture subsidy":
-                filtered_schemes = []
-                query_words = search_query.lower().split()
-                
-                for scheme in live_schemes:
-                    scheme_text = (
-                        scheme.get('scheme_name', '') + " " + 
-                        scheme.get('description', '') + " " + 
-                        scheme.get('category', '')
+                scheme_texts = [
+                    (
+                        scheme.scheme_name + " " + 
+                        scheme.description + " " + 
+                        scheme.category
                     ).lower()
-                    
-                    if any(word in scheme_text for word in query_words):
-                        filtered_schemes.append(scheme)
+                    for scheme in live_schemes
+                ]
+                
+                # Query words hold no whitespace, so a single containment check
+                # against the newline-joined texts drops words no scheme has
+                corpus = "\n".join(scheme_texts)
+                query_words = [word for word in search_query.lower().split() if word in corpus]
+                
+                filtered_schemes = []
+                if query_words:
+                    for scheme, scheme_text in zip(live_schemes, scheme_texts):
+                        if any(word in scheme_text for word in query_words):
+                            filtered_schemes.append(scheme)
+                            if len(filtered_schemes) >= max_results:
+                                break
                 
                 live_schemes = filtered_schemes[:max_results]
             else:
@@ -1237,27 +1542,27 @@ class SubsidyMCPServer:
                     text=f"🔍 No schemes found matching '{search_query}' in the live Data.gov results.\n\nThe Data.gov API returned data but none matched your specific search terms."
                 )]
             
-            result_text = f"🌐 Live Data.gov API Results for '{search_query}':\n"
-            result_text += f"📊 Found {len(live_schemes)} relevant datasets/schemes\n\n"
+            parts = [f"🌐 Live Data.gov API Results for '{search_query}':\n"]
+            parts.append(f"📊 Found {len(live_schemes)} relevant datasets/schemes\n\n")
             
             for i, scheme in enumerate(live_schemes, 1):
-                result_text += f"{i}. 🔗 {scheme.get('scheme_name', 'Unknown Dataset')}\n"
-                result_text += f"   🏛️  Source: {scheme.get('ministry', 'Government')}\n"
-                result_text += f"   📝 Description: {scheme.get('description', 'N/A')[:150]}...\n"
-                result_text += f"   🏷️  Category: {scheme.get('category', 'N/A')}\n"
-                result_text += f"   🌐 URL: {scheme.get('website', 'N/A')}\n"
-                result_text += f"   🕒 Last Updated: {scheme.get('last_updated', 'N/A')}\n"
+                parts.append(f"{i}. 🔗 {scheme.scheme_name or 'Unknown Dataset'}\n")
+                parts.append(f"   🏛️  Source: {scheme.ministry or 'Government'}\n")
+                parts.append(f"   📝 Description: {(scheme.description or 'N/A')[:150]}...\n")
+                parts.append(f"   🏷️  Category: {scheme.category or 'N/A'}\n")
+                parts.append(f"   🌐 URL: {scheme.website or 'N/A'}\n")
+                parts.append(f"   🕒 Last Updated: {scheme.last_updated or 'N/A'}\n")
                 
-                if scheme.get('dataset_id'):
-                    result_text += f"   🆔 Dataset ID: {scheme.get('dataset_id')}\n"
+                if scheme.dataset_id:
+                    parts.append(f"   🆔 Dataset ID: {scheme.dataset_id}\n")
                 
-                result_text += "\n"
+                parts.append("\n")
             
-            result_text += "💡 These are live datasets from the official Data.gov catalog.\n"
-            result_text += "💡 Visit the provided URLs for detailed information and data access.\n"
-            result_text += f"🔄 Data fetched: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            parts.append("💡 These are live datasets from the official Data.gov catalog.\n")
+            parts.append("💡 Visit the provided URLs for detailed information and data access.\n")
+            parts.append(f"🔄 Data fetched: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(
@@ -1268,13 +1573,17 @@ class SubsidyMCPServer:
 async def main():
     """Main function to run the MCP server"""
     server_instance = SubsidyMCPServer()
+    server_instance.start()
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            server_instance.server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                server_instance.server.create_initialization_options()
+            )
+    finally:
+        await server_instance.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
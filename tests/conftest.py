@@ -0,0 +1,30 @@
+"""
+Shared pytest configuration for KissanDial tests
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path once for the whole session
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+@pytest.fixture(scope="session")
+def mcp_tools():
+    """Mock MCP tools, loaded once per test session (None if the bridge is unavailable)
+
+    Returns a namespace with the tool list and a name -> tool lookup.
+    """
+    try:
+        from tools.mcp_bridge_simple import load_mcp_tools
+    except ImportError as e:
+        print(f"MCP bridge not available: {e}", file=sys.stderr)
+        return None
+    return index_tools(load_mcp_tools())
+
+def index_tools(tools):
+    """Wrap a tool list with a by_name dict for direct lookup"""
+    return SimpleNamespace(tools=tools, by_name={t.metadata.name: t for t in tools})
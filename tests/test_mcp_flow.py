@@ -5,91 +5,102 @@ Tests the complete flow from voice input to MCP tool execution
 
 import asyncio
 import pytest
+import pytest_asyncio
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-# Add project root to path
+# The project root is put on sys.path by conftest.py
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-# Import MCP bridge
-try:
-    from tools.mcp_bridge_simple import load_mcp_tools
-    MCP_BRIDGE_AVAILABLE = True
-except ImportError as e:
-    print(f"MCP bridge not available: {e}", file=sys.stderr)
-    MCP_BRIDGE_AVAILABLE = False
+# MCP servers the bridge connection test talks to
+SERVER_PATHS = {
+    "test_subsidy": str(project_root / "servers" / "subsidy_mcp.py"),
+    "test_price": str(project_root / "servers" / "price_mcp.py"),
+    "test_weather": str(project_root / "servers" / "community" / "weather_mcp.py"),
+}
+
+# Tools the mock bridge must provide
+EXPECTED_TOOLS = frozenset({"subsidy_search", "get_mandi_price", "get_current_weather"})
+
+@asynccontextmanager
+async def mcp_bridge_session():
+    """Connect one MCPBridge to every test server concurrently, disconnecting on exit"""
+    try:
+        from tools.mcp_bridge import MCPBridge
+    except ImportError:
+        yield None
+        return
+    
+    bridge = MCPBridge()
+    try:
+        await asyncio.gather(*(
+            bridge.connect_stdio_server(name, path) for name, path in SERVER_PATHS.items()
+        ))
+        yield bridge
+    finally:
+        await bridge.disconnect_all()
 
-try:
-    from tools.mcp_bridge import MCPBridge
-    MCP_ORIGINAL_AVAILABLE = True
-except ImportError:
-    MCP_ORIGINAL_AVAILABLE = False
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_bridge():
+    """MCP server connections shared by the whole test session"""
+    async with mcp_bridge_session() as bridge:
+        yield bridge
 
 class TestMCPFlow:
     """Test MCP integration flow"""
     
-    def test_load_mcp_tools(self):
+    def test_load_mcp_tools(self, mcp_tools):
         """Test that MCP tools can be loaded"""
-        if not MCP_BRIDGE_AVAILABLE:
+        if mcp_tools is None:
             print("MCP bridge not available, skipping test")
             return
             
-        tools = load_mcp_tools()
+        tools = mcp_tools.tools
         
         # Should load tools successfully
         assert isinstance(tools, list)
         assert len(tools) > 0, "Should have loaded mock tools"
         print(f"Loaded {len(tools)} MCP tools")
         
-        tool_names = [tool.metadata.name for tool in tools]
-        print(f"Available tools: {tool_names}")
+        print(f"Available tools: {list(mcp_tools.by_name)}")
         
         # Check for expected tools
-        expected_tools = ["subsidy_search", "get_mandi_price", "get_current_weather"]
-        for expected in expected_tools:
-            assert expected in tool_names, f"Should have {expected} tool"
+        missing = EXPECTED_TOOLS - mcp_tools.by_name.keys()
+        assert not missing, f"Should have {sorted(missing)} tools"
     
-    @pytest.mark.asyncio
-    async def test_mcp_bridge_connection(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_mcp_bridge_connection(self, mcp_bridge):
         """Test MCP bridge can connect to servers"""
-        if not MCP_ORIGINAL_AVAILABLE:
+        if mcp_bridge is None:
             print("Original MCP bridge not available, skipping connection test")
             return
-            
-        bridge = MCPBridge()
         
-        # Test connection to subsidy server
-        server_path = str(project_root / "servers" / "subsidy_mcp.py")
+        # Test the shared connections, loading each server's tools concurrently
         try:
-            connected = await bridge.connect_stdio_server("test_subsidy", server_path)
+            connected = [name for name in SERVER_PATHS if name in mcp_bridge.active_sessions]
             if connected:
-                tools = await bridge.load_tools_from_server("test_subsidy")
-                assert isinstance(tools, list)
-                print(f"Connected to subsidy server, got {len(tools)} tools")
+                results = await asyncio.gather(*(
+                    mcp_bridge.load_tools_from_server(name) for name in connected
+                ))
+                for name, tools in zip(connected, results):
+                    assert isinstance(tools, list)
+                    print(f"Connected to {name}, got {len(tools)} tools")
             else:
-                print("Could not connect to subsidy server (expected with current implementation)")
+                print("Could not connect to MCP servers (expected with current implementation)")
         except Exception as e:
-            print(f"Expected error connecting to subsidy server: {e}")
-        finally:
-            await bridge.disconnect_all()
+            print(f"Expected error connecting to MCP servers: {e}")
     
-    def test_tool_execution_simulation(self):
+    def test_tool_execution_simulation(self, mcp_tools):
         """Test tool execution with mock data"""
-        if not MCP_BRIDGE_AVAILABLE:
+        if mcp_tools is None:
             print("MCP bridge not available, skipping test")
             return
             
-        tools = load_mcp_tools()
-        
-        assert len(tools) > 0, "Should have tools available"
+        assert len(mcp_tools.tools) > 0, "Should have tools available"
         
-        # Find a subsidy search tool
-        subsidy_tool = None
-        for tool in tools:
-            if 'subsidy_search' in tool.metadata.name:
-                subsidy_tool = tool
-                break
+        # Find the subsidy search tool
+        subsidy_tool = mcp_tools.by_name.get("subsidy_search")
         
         assert subsidy_tool is not None, "Should have subsidy search tool"
         
@@ -103,11 +114,11 @@ class TestMCPFlow:
         except Exception as e:
             assert False, f"Tool execution should not fail: {e}"
     
-    def test_simulated_voice_flow(self):
+    def test_simulated_voice_flow(self, mcp_tools):
         """Simulate the complete voice interaction flow"""
         print("\\n=== Simulating Voice Flow ===")
         
-        if not MCP_BRIDGE_AVAILABLE:
+        if mcp_tools is None:
             print("MCP bridge not available, skipping voice flow test")
             return
         
@@ -116,16 +127,11 @@ class TestMCPFlow:
         print(f"User Query: {user_query}")
         
         # 2. Load MCP tools
-        tools = load_mcp_tools()
-        print(f"Available tools: {len(tools)}")
-        assert len(tools) > 0, "Should have tools available"
+        print(f"Available tools: {len(mcp_tools.tools)}")
+        assert len(mcp_tools.tools) > 0, "Should have tools available"
         
         # 3. Find relevant tool
-        price_tool = None
-        for tool in tools:
-            if 'get_mandi_price' in tool.metadata.name or 'price' in tool.metadata.name:
-                price_tool = tool
-                break
+        price_tool = mcp_tools.by_name.get("get_mandi_price")
         
         assert price_tool is not None, "Should have price tool"
         print(f"Found relevant tool: {price_tool.metadata.name}")
@@ -146,9 +152,9 @@ class TestMCPFlow:
         except Exception as e:
             assert False, f"Voice flow should not fail: {e}"
     
-    def test_error_handling(self):
+    def test_error_handling(self, mcp_tools):
         """Test error handling in MCP flow"""
-        tools = load_mcp_tools()
+        tools = mcp_tools.tools if mcp_tools else None
         
         if not tools:
             print("No tools to test error handling")
@@ -164,41 +170,42 @@ class TestMCPFlow:
                 print(f"Tool error (expected): {e}")
 
 if __name__ == "__main__":
-    # Run tests directly
-    test_flow = TestMCPFlow()
+    # Run tests directly; without pytest, set up what conftest.py provides
+    sys.path.insert(0, str(project_root))
+    from conftest import index_tools
+    from tools.mcp_bridge_simple import load_mcp_tools
+    tools = index_tools(load_mcp_tools())
     
-    print("🧪 Running MCP Flow Tests")
-    print("=" * 50)
+    test_flow = TestMCPFlow()
     
-    try:
-        test_flow.test_load_mcp_tools()
-        print("✅ test_load_mcp_tools passed")
-    except Exception as e:
-        print(f"❌ test_load_mcp_tools failed: {e}")
+    async def run_bridge_connection(_tools):
+        async with mcp_bridge_session() as bridge:
+            await test_flow.test_mcp_bridge_connection(bridge)
     
-    try:
-        asyncio.run(test_flow.test_mcp_bridge_connection())
-        print("✅ test_mcp_bridge_connection passed")
-    except Exception as e:
-        print(f"❌ test_mcp_bridge_connection failed: {e}")
+    # (name, function, is_async) in run order
+    flow_tests = [
+        ("test_load_mcp_tools", test_flow.test_load_mcp_tools, False),
+        ("test_mcp_bridge_connection", run_bridge_connection, True),
+        ("test_tool_execution_simulation", test_flow.test_tool_execution_simulation, False),
+        ("test_simulated_voice_flow", test_flow.test_simulated_voice_flow, False),
+        ("test_error_handling", test_flow.test_error_handling, False),
+    ]
     
-    try:
-        test_flow.test_tool_execution_simulation()
-        print("✅ test_tool_execution_simulation passed")
-    except Exception as e:
-        print(f"❌ test_tool_execution_simulation failed: {e}")
+    async def run_all():
+        for name, fn, is_async in flow_tests:
+            try:
+                if is_async:
+                    await fn(tools)
+                else:
+                    fn(tools)
+                print(f"✅ {name} passed")
+            except Exception as e:
+                print(f"❌ {name} failed: {e}")
     
-    try:
-        test_flow.test_simulated_voice_flow()
-        print("✅ test_simulated_voice_flow passed")
-    except Exception as e:
-        print(f"❌ test_simulated_voice_flow failed: {e}")
+    print("🧪 Running MCP Flow Tests")
+    print("=" * 50)
     
-    try:
-        test_flow.test_error_handling()
-        print("✅ test_error_handling passed")
-    except Exception as e:
-        print(f"❌ test_error_handling failed: {e}")
+    asyncio.run(run_all())
     
     print("\\n🏁 Test run completed")
     print("Note: Some failures are expected when MCP servers are not running")
@@ -0,0 +1,103 @@
+"""
+Test subsidy search for KissanDial
+Checks the subsidy server's scheme ranking and local CSV search
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+subsidy_mcp = pytest.importorskip("servers.subsidy_mcp")
+
+@pytest.fixture(scope="module")
+def server():
+    """One subsidy server for the module (no network; live refresh is never started)"""
+    return subsidy_mcp.SubsidyMCPServer()
+
+def baseline_search(schemes, query, max_results):
+    """The original per-word substring scorer the optimized search must match"""
+    query_words = query.lower().split()
+    matching_schemes = []
+    for scheme in schemes:
+        search_text = ' '.join([
+            scheme.scheme_name,
+            scheme.description,
+            scheme.category,
+            scheme.states,
+            ' '.join(scheme.documents_required)
+        ]).lower()
+
+        score = 0
+        for word in query_words:
+            if word in search_text:
+                score += 1
+                if word in scheme.scheme_name.lower():
+                    score += 2
+                if word in scheme.category.lower():
+                    score += 1
+
+        if score > 0:
+            matching_schemes.append((score, scheme))
+
+    matching_schemes.sort(key=lambda x: x[0], reverse=True)
+    return [scheme for _, scheme in matching_schemes[:max_results]]
+
+class TestSubsidySearch:
+    """Test scheme search against reference behaviour"""
+
+    @pytest.mark.parametrize("query", [
+        "farm mer", "ran ance", "ate ter", "ible edi", "yoj jana", "bima ima",
+        "in insurance", "sch scheme", "card car", "irri gation water",
+        "crop insurance", "kisan credit card", "PM-KISAN", "",
+    ])
+    def test_matches_baseline_scorer(self, server, query):
+        """Overlapping and nested query words score as they did originally"""
+        expected = baseline_search(server.real_world_schemes, query, 5)
+        assert server.search_real_world_schemes(query, 5) == expected
+
+    def test_local_search_spans_columns(self, tmp_path):
+        """A query spanning two columns matches on the Polars and pandas paths alike"""
+        csv_path = tmp_path / "subsidies.csv"
+        pd.DataFrame([
+            {"scheme_name": "Drip Irrigation Subsidy", "states": "Karnataka", "category": "Irrigation"},
+            {"scheme_name": "Seed Aid", "states": "Kerala", "category": None},
+        ]).to_csv(csv_path, index=False)
+
+        local = subsidy_mcp.SubsidyMCPServer()
+        local.df = pd.read_csv(csv_path)
+        local._df_text = local.build_row_text(local.df)
+
+        paths = [None]
+        if subsidy_mcp.POLARS_AVAILABLE:
+            paths.append(subsidy_mcp.pl.scan_csv(csv_path))
+
+        def names(query):
+            return [scheme.scheme_name for scheme in local.search_local_data(query, 5)]
+
+        for lazy_frame in paths:
+            local._lf = lazy_frame
+            assert names("subsidy karnataka") == ["Drip Irrigation Subsidy"]
+            assert names("aid ker") == ["Seed Aid"]
+            assert names("karnataka irrigation") == ["Drip Irrigation Subsidy"]
+            assert names("kerala irrigation") == []
+
+    @pytest.mark.parametrize("state", ["Punjab", "punjab", "haryana", "kar", "All States", ""])
+    def test_state_filter_matches_substring_scan(self, state):
+        """State lookups keep every scheme whose states field contains the query"""
+        local = subsidy_mcp.SubsidyMCPServer()
+        local.real_world_schemes = local.real_world_schemes + [
+            subsidy_mcp.Scheme(scheme_name="Kharif Seed Aid", states="Punjab, Haryana"),
+            subsidy_mcp.Scheme(scheme_name="Punjab Canal Scheme", states="Punjab and Haryana"),
+            subsidy_mcp.Scheme(scheme_name="Wheat Procurement", states="Punjab/Haryana"),
+            subsidy_mcp.Scheme(scheme_name="Unlisted Scheme", states=""),
+        ]
+        local._rebuild_indices()
+
+        state_lower = state.lower()
+        expected = sum(
+            1 for scheme in local.real_world_schemes
+            if state_lower in scheme.states.lower() or 'all states' in scheme.states.lower()
+        )
+        result = asyncio.run(local.get_subsidies_by_state({"state": state}))
+        assert f"Found {expected} subsidies" in result[0].text
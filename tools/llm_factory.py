@@ -3,10 +3,15 @@ LLM Factory for dynamic LLM selection based on environment configuration.
 Supports both OpenAI and Google Gemini with latest models.
 """
 
+import asyncio
+import atexit
 import os
-import google.generativeai as genai
-from llama_index.llms.openai import OpenAI
-from llama_index.llms.gemini import Gemini
+import threading
+import time
+import functools
+import weakref
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 import logging
 
@@ -29,12 +34,162 @@ DEFAULT_MODELS = {
     'gemini': 'gemini-2.0-flash-exp'  # Using latest Gemini 2.0 as default
 }
 
-def create_llm(model_override=None):
+@dataclass(frozen=True)
+class LLMConfig:
+    """LLM settings resolved from the environment"""
+    provider: str
+    model: Optional[str]
+    api_key: Optional[str]
+
+# Resolved settings, read from the environment on first use
+_cfg = None
+
+def _load_config():
+    """
+    Return the current LLM settings, reading the environment only once.
+    
+    Returns:
+        LLMConfig: Provider, default model and API key
+    """
+    global _cfg
+    if _cfg is None:
+        provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+        if provider == 'openai':
+            model = os.getenv('OPENAI_MODEL') or DEFAULT_MODELS['openai']
+            api_key = os.getenv('OPENAI_API_KEY')
+        elif provider == 'gemini':
+            model = os.getenv('GEMINI_MODEL') or DEFAULT_MODELS['gemini']
+            api_key = os.getenv('GEMINI_API_KEY')
+        else:
+            model = None
+            api_key = None
+        _cfg = LLMConfig(provider=provider, model=model, api_key=api_key)
+    return _cfg
+
+def reset_config(**updated):
+    """
+    Drop the cached settings; call after editing .env.
+    
+    Args:
+        **updated: Variables just written to .env (e.g. GEMINI_MODEL=...);
+            only these override the current environment, so values exported
+            in the shell are kept
+    """
+    global _cfg
+    os.environ.update(updated)
+    load_dotenv()
+    _cfg = None
+
+# HTTP connection pools shared by every OpenAI client, created on first use:
+# one for sync calls, and one per event loop for async calls since an
+# httpx.AsyncClient's connections belong to the loop that opened them
+_http_client = None
+_async_http_clients = weakref.WeakKeyDictionary()
+
+# OpenAI clients built on each event loop's async pool, keyed by
+# (model, api_key); kept per loop rather than in _build_llm's cache so the
+# cache holds no loops and closing a loop's pool drops its clients too
+_async_llms = weakref.WeakKeyDictionary()
+
+# Guards building the pools and LLM clients above, so concurrent first
+# calls from worker threads create each one only once; reentrant because
+# building an LLM also fetches the pools
+_build_lock = threading.RLock()
+
+def _get_http_client():
+    """Return the shared httpx.Client, closing it when the process exits."""
+    global _http_client
+    with _build_lock:
+        if _http_client is None:
+            import httpx
+            
+            _http_client = httpx.Client(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+def _get_async_http_client(loop):
+    """Return the httpx.AsyncClient shared by OpenAI clients on this event loop."""
+    client = _async_http_clients.get(loop)
+    if client is None:
+        import httpx
+        
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        _async_http_clients[loop] = client
+    return client
+
+async def aclose_http_client():
+    """Close the running event loop's shared async HTTP client, if any; call before the loop ends."""
+    loop = asyncio.get_running_loop()
+    with _build_lock:
+        _async_llms.pop(loop, None)
+        client = _async_http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+# Gemini API keys already passed to genai.configure
+_configured_keys = set()
+
+def _new_openai(model, api_key, async_http_client=None):
+    """Construct an OpenAI LLM on the shared sync pool and the given async client."""
+    from llama_index.llms.openai import OpenAI
+    
+    logging.info(f"Creating OpenAI LLM with model: {model}")
+    return OpenAI(
+        temperature=0.1,  # Slightly increased for more natural responses
+        model=model,
+        api_key=api_key,
+        http_client=_get_http_client(),
+        async_http_client=async_http_client
+    )
+
+def _build_async_llm(model, api_key, loop):
+    """Return the OpenAI LLM for (model, api_key) that shares this event loop's async pool."""
+    llms = _async_llms.setdefault(loop, {})
+    llm = llms.get((model, api_key))
+    if llm is None:
+        llm = llms[(model, api_key)] = _new_openai(model, api_key, _get_async_http_client(loop))
+    return llm
+
+@functools.lru_cache(maxsize=8)
+def _build_llm(provider, model, api_key):
+    """
+    Construct the LLM client for a (provider, model, api_key) combination.
+    
+    Cached so repeat calls reuse one client and its connection pool.
+    Provider SDKs are imported here so only the selected one is loaded.
+    """
+    if provider == 'openai':
+        return _new_openai(model, api_key)
+    
+    import google.generativeai as genai
+    from llama_index.llms.gemini import Gemini
+    
+    # Configure the Gemini API once per key
+    if api_key not in _configured_keys:
+        genai.configure(api_key=api_key)
+        _configured_keys.add(api_key)
+    
+    logging.info(f"Creating Gemini LLM with model: {model}")
+    return Gemini(
+        model=model,
+        temperature=0.1,  # Slightly increased for more natural responses
+        api_key=api_key
+    )
+
+def create_llm(model_override=None, loop=None):
     """
     Create and return an LLM instance based on the LLM_PROVIDER environment variable.
     
     Args:
         model_override (str, optional): Override the default model selection
+        loop (asyncio.AbstractEventLoop, optional): Event loop the LLM's async
+            calls will run on; defaults to the running loop, if any
     
     Returns:
         LLM instance (OpenAI or Gemini)
@@ -42,42 +197,39 @@ def create_llm(model_override=None):
     Raises:
         ValueError: If LLM_PROVIDER is not supported or required API keys are missing
     """
-    llm_provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+    cfg = _load_config()
+    llm_provider = cfg.provider
+    api_key = cfg.api_key
     
     if llm_provider == 'openai':
-        api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        model = model_override or os.getenv('OPENAI_MODEL') or DEFAULT_MODELS['openai']
+        model = model_override or cfg.model
         
-        logging.info(f"Creating OpenAI LLM with model: {model}")
-        return OpenAI(
-            temperature=0.1,  # Slightly increased for more natural responses
-            model=model,
-            api_key=api_key
-        )
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        
+        with _build_lock:
+            if loop is not None:
+                return _build_async_llm(model, api_key, loop)
+            return _build_llm(llm_provider, model, api_key)
     
     elif llm_provider == 'gemini':
-        api_key = os.getenv('GEMINI_API_KEY')
         if not api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
         
-        # Configure the Gemini API  
-        genai.configure(api_key=api_key)
-        
-        model = model_override or os.getenv('GEMINI_MODEL') or DEFAULT_MODELS['gemini']
+        model = model_override or cfg.model
         
         # Validate model is in available list
         if model not in GEMINI_MODELS:
             logging.warning(f"Model {model} not in known model list. Available models: {list(GEMINI_MODELS.keys())}")
         
-        logging.info(f"Creating Gemini LLM with model: {model}")
-        return Gemini(
-            model=model,
-            temperature=0.1,  # Slightly increased for more natural responses
-            api_key=api_key
-        )
+        with _build_lock:
+            return _build_llm(llm_provider, model, api_key)
     
     else:
         raise ValueError(f"Unsupported LLM provider: {llm_provider}. Supported providers: 'openai', 'gemini'")
@@ -89,7 +241,8 @@ def get_provider_info():
     Returns:
         dict: Information about the current provider
     """
-    llm_provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+    cfg = _load_config()
+    llm_provider = cfg.provider
     
     info = {
         'provider': llm_provider,
@@ -99,12 +252,12 @@ def get_provider_info():
     }
     
     if llm_provider == 'openai':
-        info['api_key_configured'] = bool(os.getenv('OPENAI_API_KEY'))
-        info['model'] = os.getenv('OPENAI_MODEL') or DEFAULT_MODELS['openai']
+        info['api_key_configured'] = bool(cfg.api_key)
+        info['model'] = cfg.model
         info['available_models'] = ['gpt-4o', 'gpt-4', 'gpt-3.5-turbo']
     elif llm_provider == 'gemini':
-        info['api_key_configured'] = bool(os.getenv('GEMINI_API_KEY'))
-        info['model'] = os.getenv('GEMINI_MODEL') or DEFAULT_MODELS['gemini']
+        info['api_key_configured'] = bool(cfg.api_key)
+        info['model'] = cfg.model
         info['available_models'] = list(GEMINI_MODELS.keys())
         info['model_descriptions'] = GEMINI_MODELS
     
@@ -121,7 +274,7 @@ def list_available_models(provider=None):
         dict: Available models with descriptions
     """
     if provider is None:
-        provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+        provider = _load_config().provider
     
     if provider == 'gemini':
         return GEMINI_MODELS
@@ -134,12 +287,16 @@ def list_available_models(provider=None):
     else:
         return {}
 
-def test_llm_connection():
+async def test_llm_connection(on_token=None):
     """
-    Test the current LLM configuration by making a simple API call.
+    Test the current LLM configuration by streaming a short completion.
+    
+    Args:
+        on_token (callable, optional): Called with each text delta as it arrives
     
     Returns:
-        dict: Test results with success status and details
+        dict: Test results with success status, details and latency
+            (first_token_ms, total_ms)
     """
     try:
         llm = create_llm()
@@ -147,13 +304,26 @@ def test_llm_connection():
         
         # Simple test prompt
         test_prompt = "Say 'Hello from KissanDial!' in one sentence."
-        response = llm.complete(test_prompt)
+        
+        start_time = time.perf_counter()
+        first_token_ms = None
+        deltas = []
+        async for chunk in await llm.astream_complete(test_prompt):
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - start_time) * 1000
+            delta = chunk.delta or ''
+            deltas.append(delta)
+            if on_token:
+                on_token(delta)
+        total_ms = (time.perf_counter() - start_time) * 1000
         
         return {
             'success': True,
             'provider': provider_info['provider'],
             'model': provider_info['model'],
-            'response': str(response),
+            'response': ''.join(deltas),
+            'first_token_ms': first_token_ms,
+            'total_ms': total_ms,
             'message': f"Successfully connected to {provider_info['provider']} with model {provider_info['model']}"
         }
     
@@ -163,3 +333,6 @@ def test_llm_connection():
             'error': str(e),
             'message': f"Failed to connect to LLM: {str(e)}"
         }
+
+# A connection check for the CLI, not a pytest test despite the name
+test_llm_connection.__test__ = False
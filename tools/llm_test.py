@@ -6,9 +6,12 @@ This script helps test and manage the LLM configuration for KissanDial.
 It can test connections, list available models, and benchmark different models.
 """
 
+import asyncio
 import os
+import re
 import sys
 import time
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Add the project root to the path so we can import our modules
@@ -19,9 +22,15 @@ from tools.llm_factory import (
     get_provider_info, 
     list_available_models, 
     test_llm_connection,
+    reset_config,
+    aclose_http_client,
+    _load_config,
     GEMINI_MODELS
 )
 
+# Matches the GEMINI_MODEL line in .env
+_GEMINI_MODEL_RE = re.compile(r'^GEMINI_MODEL=.*$', re.MULTILINE)
+
 def print_header(title):
     """Print a formatted header."""
     print("\n" + "="*60)
@@ -44,12 +53,13 @@ def print_available_models():
     """Display all available models for current provider."""
     print_header("Available Models")
     
-    provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+    provider = _load_config().provider
     models = list_available_models(provider)
     
+    current_model = get_provider_info()['model']
     print(f"Available {provider.upper()} models:")
     for model, description in models.items():
-        current = "→ " if model == get_provider_info()['model'] else "  "
+        current = "→ " if model == current_model else "  "
         print(f"{current}{model}: {description}")
 
 def test_connection():
@@ -57,18 +67,68 @@ def test_connection():
     print_header("Connection Test")
     
     print("Testing LLM connection...")
-    result = test_llm_connection()
+    
+    # Print the response as it streams in
+    streamed = []
+    
+    def print_delta(delta):
+        if not streamed:
+            print("Test response: ", end="")
+        streamed.append(delta)
+        print(delta, end="", flush=True)
+    
+    async def run_test():
+        try:
+            return await test_llm_connection(on_token=print_delta)
+        finally:
+            # The loop ends with asyncio.run, so release its connections now
+            await aclose_http_client()
+    
+    result = asyncio.run(run_test())
+    if streamed:
+        print()
     
     if result['success']:
         print("✓ Connection successful!")
         print(f"Provider: {result['provider']}")
         print(f"Model: {result['model']}")
-        print(f"Test response: {result['response']}")
+        if result['first_token_ms'] is not None:
+            print(f"First token: {result['first_token_ms']:.0f}ms, total: {result['total_ms']:.0f}ms")
     else:
         print("✗ Connection failed!")
         print(f"Error: {result['error']}")
 
-def benchmark_models():
+async def _benchmark_model(model, prompt):
+    """Time one model's completion of the prompt."""
+    try:
+        print(f"\nTesting {model}...")
+        
+        start_time = time.time()
+        # Build the client off the event loop so the other models' requests keep running
+        llm = await asyncio.to_thread(
+            create_llm, model_override=model, loop=asyncio.get_running_loop()
+        )
+        response = await llm.acomplete(prompt)
+        end_time = time.time()
+        
+        result = {
+            'response': str(response),
+            'time': end_time - start_time,
+            'success': True
+        }
+        
+        print(f"✓ {model}: {result['time']:.2f}s")
+        
+    except Exception as e:
+        result = {
+            'error': str(e),
+            'success': False
+        }
+        print(f"✗ {model}: {str(e)}")
+    
+    return result
+
+async def benchmark_models():
     """Benchmark different models with a farmer-specific prompt."""
     print_header("Model Benchmark")
     
@@ -80,38 +140,21 @@ def benchmark_models():
     Please provide a helpful response in 2-3 sentences.
     """
     
-    provider = os.getenv('LLM_PROVIDER', 'openai').lower()
+    provider = _load_config().provider
     
     if provider == 'gemini':
         models_to_test = ['gemini-2.0-flash-exp', 'gemini-1.5-pro', 'gemini-1.5-flash']
     else:
         models_to_test = ['gpt-4o', 'gpt-4']
     
-    results = {}
-    
-    for model in models_to_test:
-        try:
-            print(f"\nTesting {model}...")
-            
-            start_time = time.time()
-            llm = create_llm(model_override=model)
-            response = llm.complete(test_prompt)
-            end_time = time.time()
-            
-            results[model] = {
-                'response': str(response),
-                'time': end_time - start_time,
-                'success': True
-            }
-            
-            print(f"✓ {model}: {results[model]['time']:.2f}s")
-            
-        except Exception as e:
-            results[model] = {
-                'error': str(e),
-                'success': False
-            }
-            print(f"✗ {model}: {str(e)}")
+    # Query all models at once so the benchmark takes as long as the slowest one
+    try:
+        outcomes = await asyncio.gather(
+            *(_benchmark_model(model, test_prompt) for model in models_to_test)
+        )
+    finally:
+        await aclose_http_client()
+    results = dict(zip(models_to_test, outcomes))
     
     # Display results
     print_header("Benchmark Results")
@@ -143,7 +186,7 @@ def interactive_menu():
         elif choice == '3':
             test_connection()
         elif choice == '4':
-            benchmark_models()
+            asyncio.run(benchmark_models())
         elif choice == '5':
             set_gemini_model()
         elif choice == '6':
@@ -158,15 +201,16 @@ def set_gemini_model():
     """Interactive Gemini model selection."""
     print_header("Set Gemini Model")
     
-    if os.getenv('LLM_PROVIDER', '').lower() != 'gemini':
+    if _load_config().provider != 'gemini':
         print("LLM_PROVIDER is not set to 'gemini'. Please update your .env file first.")
         return
     
     print("Available Gemini models:")
     models = list(GEMINI_MODELS.keys())
+    current_model = get_provider_info()['model']
     
     for i, model in enumerate(models, 1):
-        current = " (current)" if model == get_provider_info()['model'] else ""
+        current = " (current)" if model == current_model else ""
         print(f"{i}. {model}: {GEMINI_MODELS[model]}{current}")
     
     try:
@@ -178,25 +222,21 @@ def set_gemini_model():
             env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
             
             if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    lines = f.readlines()
+                env_file = Path(env_path)
+                text = env_file.read_text()
                 
                 # Update or add GEMINI_MODEL line
-                updated = False
-                for i, line in enumerate(lines):
-                    if line.startswith('GEMINI_MODEL='):
-                        lines[i] = f'GEMINI_MODEL={selected_model}\n'
-                        updated = True
-                        break
+                line = f'GEMINI_MODEL={selected_model}'
+                updated, count = _GEMINI_MODEL_RE.subn(lambda _: line, text, count=1)
+                if not count:
+                    updated = text.rstrip('\n') + f'\n{line}\n' if text else f'{line}\n'
                 
-                if not updated:
-                    lines.append(f'GEMINI_MODEL={selected_model}\n')
+                env_file.write_text(updated)
                 
-                with open(env_path, 'w') as f:
-                    f.writelines(lines)
+                # Pick up the new .env on the next create_llm call
+                reset_config(GEMINI_MODEL=selected_model)
                 
                 print(f"✓ Model set to {selected_model}")
-                print("Please restart the application to use the new model.")
             else:
                 print("✗ .env file not found. Please create one first.")
         else:
@@ -217,7 +257,7 @@ def main():
         elif command == 'test':
             test_connection()
         elif command == 'benchmark':
-            benchmark_models()
+            asyncio.run(benchmark_models())
         else:
             print(f"Unknown command: {command}")
             print("Available commands: info, models, test, benchmark")
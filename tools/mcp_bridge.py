@@ -1,15 +1,32 @@
 """
 MCP Bridge for KissanDial
 Converts MCP tools to LlamaIndex FunctionTool on-the-fly
+
+If uvloop is installed (optional, POSIX only), the bridge runs its server
+sessions on a uvloop event loop for cheaper subprocess stdio.
 """
 
 import asyncio
+import atexit
 import json
+import os
 import subprocess
 import sys
-from typing import Any, Dict, List, Optional, Callable
+import threading
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 try:
     from llama_index.core.tools import FunctionTool, ToolMetadata
 except ImportError:
@@ -26,17 +43,24 @@ except ImportError:
             self.metadata = metadata
         
         @classmethod
-        def from_defaults(cls, fn, name, description):
+        def from_defaults(cls, fn, name, description, async_fn=None):
             metadata = ToolMetadata(name=name, description=description)
-            return cls(fn, metadata)
+            tool = cls(fn, metadata)
+            tool.async_fn = async_fn
+            return tool
         
         def call(self, *args, **kwargs):
             return self.fn(*args, **kwargs)
+        
+        async def acall(self, *args, **kwargs):
+            return await self.async_fn(*args, **kwargs)
 
 # Import MCP clients with fallback
 try:
+    import anyio
     from mcp.client.session import ClientSession
-    from mcp.client.stdio import stdio_client
+    from mcp.shared.message import SessionMessage
+    from mcp.types import JSONRPCMessage, Tool
     MCP_AVAILABLE = True
 except ImportError:
     print("MCP not available, using mock implementations", file=sys.stderr)
@@ -50,38 +74,109 @@ except ImportError:
         async def call_tool(self, name, args): 
             return type('obj', (object,), {'content': [type('obj', (object,), {'text': 'Mock response'})()]})()
         async def close(self): pass
-    
-    def stdio_client(process):
-        return None, None
 
 class MCPBridge:
     """Bridge between MCP servers and LlamaIndex tools"""
     
-    def __init__(self):
+    # Bytes read from a server's stdout per read call
+    READ_CHUNK_SIZE = 1 << 16
+    
+    # StreamReader buffer limit for server stdout; the pipe is only paused
+    # once twice this much is buffered unread
+    STREAM_LIMIT = 1 << 20
+    
+    # Kernel buffer requested for server stdio pipes where the OS lets us
+    # resize them (Linux); the default is 64 KiB
+    PIPE_SIZE = 1 << 20
+    
+    def __init__(self, call_timeout: float = 60.0, connect_timeout: float = 10.0):
         self.active_sessions: Dict[str, ClientSession] = {}
         self.tools: List[FunctionTool] = []
         
+        # Seconds a synchronous tool call waits for its result, and a server
+        # gets to start and finish the MCP handshake
+        self._call_timeout = call_timeout
+        self._connect_timeout = connect_timeout
+        
+        # Script path per known server, used to connect on first tool call,
+        # and the raw tool definitions each server reported
+        self._server_paths: Dict[str, str] = {}
+        self._tool_defs: Dict[str, List[Any]] = {}
+        
+        # Per-server lock so concurrent first calls start a server only once
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        
+        # LlamaIndex tool name -> (server name, MCP tool name), for batch_execute
+        self._tool_routes: Dict[str, Tuple[str, str]] = {}
+        
+        # Sessions live on one long-running loop in a background thread, so
+        # they outlive any caller's asyncio.run() and sync tool calls can
+        # reach them from any thread
+        self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="mcp-bridge-loop", daemon=True
+        )
+        self._loop_thread.start()
+        
+        # Per-server subprocess, the task that owns its session, and the
+        # event that tells that task to shut the session down
+        self._processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._owners: Dict[str, asyncio.Task] = {}
+        self._stop_events: Dict[str, asyncio.Event] = {}
+        
+        # Close the servers and stop the loop thread when the interpreter exits
+        atexit.register(self.shutdown)
+        
+    def _run_sync(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the bridge loop and block for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+    
+    async def _on_loop(self, coro):
+        """Await a coroutine on the bridge loop from whatever loop the caller is on"""
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+    
     async def connect_stdio_server(self, server_name: str, server_path: str) -> bool:
         """Connect to an MCP server via stdio"""
+        self._server_paths[server_name] = server_path
+        return await self._on_loop(self._connect(server_name, server_path))
+    
+    async def _connect(self, server_name: str, server_path: str) -> bool:
+        """Start a server and its session within the connect timeout; runs on the bridge loop"""
+        try:
+            return await asyncio.wait_for(
+                self._do_connect(server_name, server_path), timeout=self._connect_timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"Timed out connecting to MCP server {server_name} "
+                  f"after {self._connect_timeout}s", file=sys.stderr)
+            # The owner may be stuck in the handshake; stop it and the process
+            owner = self._owners.get(server_name)
+            if owner is not None:
+                owner.cancel()
+            await self._close(server_name)
+            return False
+    
+    async def _do_connect(self, server_name: str, server_path: str) -> bool:
+        """Start a server and its session"""
         try:
             if not MCP_AVAILABLE:
                 print(f"MCP not available, cannot connect to {server_name}", file=sys.stderr)
                 return False
                 
-            # Start the server process
-            process = await asyncio.create_subprocess_exec(
-                sys.executable, server_path,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            # Create stdio client session
-            read_stream, write_stream = await stdio_client(process.stdout, process.stdin)
-            session = ClientSession(read_stream, write_stream)
+            process, stdout = await self._spawn(server_path)
+            self._processes[server_name] = process
             
-            # Initialize the session
-            await session.initialize()
+            # The session is entered and exited by one owner task, which
+            # hands it back here once initialized
+            ready = asyncio.get_running_loop().create_future()
+            stop = asyncio.Event()
+            self._stop_events[server_name] = stop
+            self._owners[server_name] = asyncio.create_task(
+                self._run_session(server_name, process, stdout, ready, stop)
+            )
+            session = await ready
             
             # Store the session
             self.active_sessions[server_name] = session
@@ -91,8 +186,147 @@ class MCPBridge:
             
         except Exception as e:
             print(f"Failed to connect to MCP server {server_name}: {e}", file=sys.stderr)
+            await self._close(server_name)
             return False
     
+    async def _spawn(self, server_path: str):
+        """Start a server process, returning it and a reader for its stdout
+        
+        Its stderr (logs) goes to ours.
+        """
+        if not hasattr(fcntl, "F_SETPIPE_SZ"):
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, server_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                limit=self.STREAM_LIMIT
+            )
+            return process, process.stdout
+        
+        # Create the stdout pipe ourselves so it can be enlarged before the
+        # server starts writing to it
+        read_fd, write_fd = os.pipe()
+        try:
+            self._resize_pipe(read_fd)
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, server_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=write_fd
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        
+        try:
+            stdout = asyncio.StreamReader(limit=self.STREAM_LIMIT)
+            await asyncio.get_running_loop().connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(stdout), os.fdopen(read_fd, "rb", 0)
+            )
+            # Not every loop exposes the stdin pipe (uvloop doesn't)
+            stdin_pipe = process.stdin.transport.get_extra_info("pipe")
+            if stdin_pipe is not None:
+                self._resize_pipe(stdin_pipe.fileno())
+        except BaseException:
+            # The caller never sees this process, so don't leave it running
+            process.kill()
+            await process.wait()
+            raise
+        return process, stdout
+    
+    def _resize_pipe(self, fd: int):
+        """Grow a pipe's kernel buffer to PIPE_SIZE, keeping the default if refused"""
+        try:
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, self.PIPE_SIZE)
+        except OSError:
+            pass
+    
+    async def _run_session(self, server_name: str, process: asyncio.subprocess.Process,
+                           stdout: asyncio.StreamReader,
+                           ready: asyncio.Future, stop: asyncio.Event):
+        """Own one server's ClientSession from initialization until stop is set"""
+        read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+        write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+        pumps = [
+            asyncio.create_task(self._read_messages(stdout, read_stream_writer)),
+            asyncio.create_task(self._write_messages(process.stdin, write_stream_reader)),
+        ]
+        
+        try:
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                ready.set_result(session)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                print(f"MCP session {server_name} ended with error: {e}", file=sys.stderr)
+        finally:
+            if not ready.done():
+                ready.cancel()
+            for pump in pumps:
+                pump.cancel()
+            await asyncio.gather(*pumps, return_exceptions=True)
+    
+    async def _read_messages(self, stdout: asyncio.StreamReader, read_stream_writer):
+        """Read server stdout in large chunks and forward each JSON-RPC line"""
+        buffer = bytearray()
+        async with read_stream_writer:
+            while True:
+                chunk = await stdout.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer += chunk
+                
+                # Only complete lines are parsed; a partial one waits for more data
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                lines = buffer[:end].split(b"\n")
+                del buffer[:end + 1]
+                
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        message = JSONRPCMessage.model_validate_json(line)
+                    except Exception as e:
+                        await read_stream_writer.send(e)
+                        continue
+                    await read_stream_writer.send(SessionMessage(message))
+    
+    async def _write_messages(self, stdin: asyncio.StreamWriter, write_stream_reader):
+        """Write each outgoing JSON-RPC message to server stdin as one line"""
+        async with write_stream_reader:
+            async for session_message in write_stream_reader:
+                data = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                stdin.write(data.encode() + b"\n")
+                await stdin.drain()
+    
+    async def _close(self, server_name: str):
+        """Shut down a server's session and subprocess"""
+        self.active_sessions.pop(server_name, None)
+        stop = self._stop_events.pop(server_name, None)
+        owner = self._owners.pop(server_name, None)
+        process = self._processes.pop(server_name, None)
+        
+        if stop is not None:
+            stop.set()
+        if owner is not None:
+            await asyncio.gather(owner, return_exceptions=True)
+        
+        if process is not None and process.returncode is None:
+            # Closing stdin lets a stdio server exit on its own
+            if process.stdin is not None:
+                process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+    
     async def load_tools_from_server(self, server_name: str) -> List[FunctionTool]:
         """Load tools from a connected MCP server"""
         if server_name not in self.active_sessions:
@@ -104,15 +338,12 @@ class MCPBridge:
         
         try:
             # List available tools from the server
-            response = await session.list_tools()
+            response = await self._on_loop(session.list_tools())
+            self._tool_defs[server_name] = response.tools
             
             for tool_def in response.tools:
                 # Create a LlamaIndex FunctionTool for each MCP tool
-                llamaindex_tool = self._create_llamaindex_tool(
-                    server_name, 
-                    tool_def, 
-                    session
-                )
+                llamaindex_tool = self._create_llamaindex_tool(server_name, tool_def)
                 tools.append(llamaindex_tool)
                 
             print(f"Loaded {len(tools)} tools from {server_name}", file=sys.stderr)
@@ -122,89 +353,281 @@ class MCPBridge:
             print(f"Error loading tools from {server_name}: {e}", file=sys.stderr)
             return []
     
-    def _create_llamaindex_tool(self, server_name: str, tool_def: Any, session: ClientSession) -> FunctionTool:
+    def load_cached_tools(self, server_configs: Dict[str, str],
+                          tool_defs: Dict[str, List[Any]]) -> List[FunctionTool]:
+        """Create tools from known definitions without starting any server
+        
+        Each server is connected on the first call to one of its tools.
+        """
+        all_tools = []
+        for server_name, server_path in server_configs.items():
+            self._server_paths[server_name] = server_path
+            self._tool_defs[server_name] = tool_defs[server_name]
+            all_tools.extend(
+                self._create_llamaindex_tool(server_name, tool_def)
+                for tool_def in tool_defs[server_name]
+            )
+        
+        self.tools = all_tools
+        return all_tools
+    
+    async def _session_for(self, server_name: str) -> ClientSession:
+        """Return the server's session, connecting to it first if needed
+        
+        Runs on the bridge loop, which the connect locks belong to.
+        """
+        session = self.active_sessions.get(server_name)
+        if session is not None:
+            return session
+        
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            # Another caller may have connected while we waited
+            if server_name not in self.active_sessions:
+                if not await self.connect_stdio_server(server_name, self._server_paths[server_name]):
+                    raise RuntimeError(f"could not connect to MCP server {server_name}")
+            return self.active_sessions[server_name]
+    
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Join the text of an MCP tool response's content blocks"""
+        result_texts = [
+            content.text if hasattr(content, 'text')
+            else str(content.data) if hasattr(content, 'data')
+            else str(content)
+            for content in response.content
+        ]
+        return "\n".join(result_texts) if result_texts else "No response from tool"
+    
+    def _call_blocking(self, tool_name: str, make_coro: Callable[[], Any]) -> str:
+        """Run a tool coroutine on the bridge loop from sync code and wait for its result"""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            # Blocking the bridge loop on itself would deadlock
+            return f"Error executing tool {tool_name}: called on the MCP bridge loop, use acall()"
+        
+        try:
+            # The session lives on the bridge loop; block until it answers
+            return self._run_sync(make_coro(), timeout=self._call_timeout)
+        except Exception as e:
+            return f"Error executing tool {tool_name}: {str(e)}"
+    
+    def _create_llamaindex_tool(self, server_name: str, tool_def: Any) -> FunctionTool:
         """Create a LlamaIndex FunctionTool from an MCP tool definition"""
         
         async def tool_function(**kwargs) -> str:
             """Async wrapper function that calls the MCP tool"""
             try:
                 # Call the MCP tool
-                response = await session.call_tool(tool_def.name, kwargs)
-                
-                # Extract text content from response
-                result_texts = []
-                for content in response.content:
-                    if hasattr(content, 'text'):
-                        result_texts.append(content.text)
-                    elif hasattr(content, 'data'):
-                        result_texts.append(str(content.data))
-                    else:
-                        result_texts.append(str(content))
-                
-                return "\n".join(result_texts) if result_texts else "No response from tool"
+                session = await self._on_loop(self._session_for(server_name))
+                response = await self._on_loop(session.call_tool(tool_def.name, kwargs))
+                return self._response_text(response)
                 
             except Exception as e:
                 return f"Error calling MCP tool {tool_def.name}: {str(e)}"
         
         def sync_tool_function(**kwargs) -> str:
             """Synchronous wrapper for the async tool function"""
-            try:
-                # Run the async function in the current event loop or create a new one
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If we're already in an async context, we need to handle this differently
-                    # For now, we'll create a new task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, tool_function(**kwargs))
-                        return future.result()
-                else:
-                    return loop.run_until_complete(tool_function(**kwargs))
-            except Exception as e:
-                return f"Error executing tool {tool_def.name}: {str(e)}"
+            return self._call_blocking(tool_def.name, lambda: tool_function(**kwargs))
         
-        # Create the tool metadata
-        metadata = ToolMetadata(
-            name=f"{server_name}_{tool_def.name}",
-            description=f"[{server_name}] {tool_def.description}",
-        )
+        # Tool names are interned since agents look tools up by name
+        tool_name = sys.intern(f"{server_name}_{tool_def.name}")
+        tool_description = f"[{server_name}] {tool_def.description}"
+        self._tool_routes[tool_name] = (server_name, tool_def.name)
         
         # Create the FunctionTool
         return FunctionTool.from_defaults(
             fn=sync_tool_function,
-            name=f"{server_name}_{tool_def.name}",
-            description=f"[{server_name}] {tool_def.description}",
+            async_fn=tool_function,
+            name=tool_name,
+            description=tool_description,
+        )
+    
+    async def batch_execute(self, calls: List[Dict[str, Any]], max_concurrent: int = 8,
+                            stop_on_error: bool = False) -> str:
+        """Run several tool calls concurrently and collect their results
+        
+        Args:
+            calls: Entries of the form {"tool": <tool name>, "args": {...}}
+            max_concurrent: Most calls in flight at once
+            stop_on_error: Skip calls not yet started once one has failed
+        
+        Returns:
+            JSON list with each call's tool name and its result or error, in order
+        """
+        return await self._on_loop(self._batch_execute(calls, max_concurrent, stop_on_error))
+    
+    async def _batch_execute(self, calls: List[Dict[str, Any]], max_concurrent: int,
+                             stop_on_error: bool) -> str:
+        """Fan calls out over their servers' sessions; runs on the bridge loop"""
+        sema = asyncio.Semaphore(max_concurrent)
+        failed = asyncio.Event()
+        
+        async def run_one(call: Dict[str, Any]) -> Dict[str, Any]:
+            tool_name = call.get("tool")
+            async with sema:
+                if stop_on_error and failed.is_set():
+                    return {"tool": tool_name, "success": False, "error": "skipped after an earlier failure"}
+                try:
+                    if tool_name not in self._tool_routes:
+                        raise ValueError(f"unknown tool {tool_name!r}")
+                    server_name, mcp_name = self._tool_routes[tool_name]
+                    session = await self._session_for(server_name)
+                    response = await session.call_tool(mcp_name, call.get("args") or {})
+                    text = self._response_text(response)
+                    if getattr(response, "isError", False):
+                        raise RuntimeError(text)
+                    return {"tool": tool_name, "success": True, "result": text}
+                except Exception as e:
+                    failed.set()
+                    return {"tool": tool_name, "success": False, "error": str(e)}
+        
+        results = await asyncio.gather(*(run_one(call) for call in calls))
+        return json.dumps(results, ensure_ascii=False)
+    
+    def create_batch_tool(self) -> FunctionTool:
+        """Create the batch_execute FunctionTool over this bridge's tools"""
+        
+        async def batch_execute(calls: List[Dict[str, Any]]) -> str:
+            """Run several MCP tool calls at once"""
+            return await self.batch_execute(calls)
+        
+        def sync_batch_execute(calls: List[Dict[str, Any]]) -> str:
+            """Synchronous wrapper for batch_execute"""
+            return self._call_blocking("batch_execute", lambda: self.batch_execute(calls))
+        
+        return FunctionTool.from_defaults(
+            fn=sync_batch_execute,
+            async_fn=batch_execute,
+            name="batch_execute",
+            description=(
+                "Run several independent tools at once. calls is a list of "
+                '{"tool": <tool name>, "args": {<tool arguments>}} objects; returns a JSON '
+                "list with each call's result or error, in the same order."
+            ),
         )
     
+    async def _bring_up(self, server_name: str, server_path: str) -> List[FunctionTool]:
+        """Connect to one server and load its tools"""
+        if not await self.connect_stdio_server(server_name, server_path):
+            return []
+        return await self.load_tools_from_server(server_name)
+    
     async def load_all_mcp_tools(self, server_configs: Dict[str, str]) -> List[FunctionTool]:
         """Load tools from all configured MCP servers"""
-        all_tools = []
+        # Bring servers up concurrently; one failing server doesn't stop the rest
+        results = await asyncio.gather(
+            *(self._bring_up(name, path) for name, path in server_configs.items()),
+            return_exceptions=True
+        )
         
-        for server_name, server_path in server_configs.items():
-            # Connect to the server
-            connected = await self.connect_stdio_server(server_name, server_path)
-            
-            if connected:
-                # Load tools from the server
-                server_tools = await self.load_tools_from_server(server_name)
-                all_tools.extend(server_tools)
+        all_tools = []
+        for server_name, result in zip(server_configs, results):
+            if isinstance(result, Exception):
+                print(f"Error loading tools from {server_name}: {result}", file=sys.stderr)
+                continue
+            all_tools.extend(result)
         
         self.tools = all_tools
         return all_tools
     
+    async def _disconnect(self, server_name: str):
+        """Close one server's session and process, reporting the outcome"""
+        try:
+            await self._close(server_name)
+            print(f"Disconnected from {server_name}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error disconnecting from {server_name}: {e}", file=sys.stderr)
+    
+    async def _disconnect_servers(self):
+        """Close every server concurrently; runs on the bridge loop"""
+        await asyncio.gather(*(self._disconnect(name) for name in list(self._processes)))
+    
     async def disconnect_all(self):
         """Disconnect from all MCP servers"""
-        for server_name, session in self.active_sessions.items():
+        await self._on_loop(self._disconnect_servers())
+        
+        self.active_sessions.clear()
+        self.tools.clear()
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Disconnect all servers, then stop the bridge loop and join its thread"""
+        atexit.unregister(self.shutdown)
+        if self._loop.is_closed():
+            return
+        
+        if threading.current_thread() is self._loop_thread:
+            # Joining from the loop's own thread would deadlock; just stop it
+            self._loop.stop()
+            return
+        
+        if self._loop.is_running():
             try:
-                await session.close()
-                print(f"Disconnected from {server_name}", file=sys.stderr)
+                self._run_sync(self._disconnect_servers(), timeout)
             except Exception as e:
-                print(f"Error disconnecting from {server_name}: {e}", file=sys.stderr)
+                print(f"Error shutting down MCP servers: {e}", file=sys.stderr)
+            self._loop.call_soon_threadsafe(self._loop.stop)
         
+        self._loop_thread.join(timeout)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
         self.active_sessions.clear()
         self.tools.clear()
 
 
+# Tool definitions discovered from the servers, reused while the server
+# scripts are unchanged
+_SCHEMA_CACHE = Path(__file__).parent.parent / ".cache" / "mcp_schemas.json"
+
+def _schema_cache_key(server_configs: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Identify a set of servers by script path and modification time.
+    
+    Returns None if any script cannot be stat'ed; the cache is then skipped
+    and each server connects (or fails) on its own.
+    """
+    servers = {}
+    for name, path in server_configs.items():
+        try:
+            servers[name] = [path, os.stat(path).st_mtime_ns]
+        except OSError as e:
+            print(f"Skipping MCP schema cache, cannot stat {path}: {e}", file=sys.stderr)
+            return None
+    return {"python": list(sys.version_info[:2]), "servers": servers}
+
+def _read_schema_cache(key: Dict[str, Any]) -> Optional[Dict[str, List[Any]]]:
+    """Return the cached tool definitions per server if the cache matches key"""
+    try:
+        cached = json.loads(_SCHEMA_CACHE.read_text())
+        if cached["key"] != key:
+            return None
+        return {
+            server_name: [Tool.model_validate(tool) for tool in tools]
+            for server_name, tools in cached["tools"].items()
+        }
+    except Exception:
+        return None
+
+def _write_schema_cache(key: Dict[str, Any], tool_defs: Dict[str, List[Any]]):
+    """Atomically store the tool definitions per server under key"""
+    data = {
+        "key": key,
+        "tools": {
+            server_name: [tool.model_dump(mode="json", exclude_none=True) for tool in tools]
+            for server_name, tools in tool_defs.items()
+        },
+    }
+    try:
+        _SCHEMA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _SCHEMA_CACHE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, _SCHEMA_CACHE)
+    except OSError as e:
+        print(f"Could not write MCP schema cache: {e}", file=sys.stderr)
+
 def load_mcp_tools() -> List[FunctionTool]:
     """
     Synchronous function to load MCP tools for use in LlamaIndex agent
@@ -223,9 +646,25 @@ def load_mcp_tools() -> List[FunctionTool]:
     bridge = MCPBridge()
     
     try:
-        # Run the async loading function
-        tools = asyncio.run(bridge.load_all_mcp_tools(server_configs))
+        # Warm start: build the tools from cached schemas and only start a
+        # server when one of its tools is first called
+        cache_key = _schema_cache_key(server_configs) if MCP_AVAILABLE else None
+        cached = _read_schema_cache(cache_key) if cache_key else None
+        if cached is not None and cached.keys() == server_configs.keys():
+            tools = bridge.load_cached_tools(server_configs, cached)
+            print(f"Loaded {len(tools)} MCP tools from schema cache", file=sys.stderr)
+            tools.append(bridge.create_batch_tool())
+            return tools
+        
+        # Connect on the bridge loop so the sessions stay open for tool calls
+        tools = bridge._run_sync(bridge.load_all_mcp_tools(server_configs))
         print(f"Successfully loaded {len(tools)} MCP tools", file=sys.stderr)
+        
+        # Only cache a complete discovery, so a failed server is retried next start
+        if cache_key and bridge._tool_defs.keys() == server_configs.keys():
+            _write_schema_cache(cache_key, bridge._tool_defs)
+        if tools:
+            tools.append(bridge.create_batch_tool())
         return tools
     except Exception as e:
         print(f"Error loading MCP tools: {e}", file=sys.stderr)
@@ -254,7 +693,8 @@ async def test_mcp_tools():
             print("\nTesting subsidy search...")
             for tool in tools:
                 if "subsidy_search" in tool.metadata.name:
-                    result = tool.call(query="tractor")
+                    # acall() hands the call to the bridge loop, where the session lives
+                    result = await tool.acall(query="tractor")
                     print(f"Result: {result}")
                     break
         
@@ -265,4 +705,5 @@ async def test_mcp_tools():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_mcp_tools())
+    runner = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
+    runner(test_mcp_tools())
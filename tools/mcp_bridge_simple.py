@@ -4,6 +4,7 @@ Creates mock tools that simulate MCP functionality for now
 """
 
 import sys
+from random import Random
 from typing import List
 from pathlib import Path
 
@@ -32,43 +33,126 @@ except ImportError:
         def call(self, *args, **kwargs):
             return self.fn(*args, **kwargs)
 
+# Random source for the mock price and weather variation
+_rng = Random()
+
+# Mock data shared by every call of the tools below
+_SUBSIDY_RESULTS = (
+    {
+        "scheme": "PM-KISAN Samman Nidhi",
+        "description": "Direct income support to farmers",
+        "amount": "₹6,000 per year",
+        "eligibility": "Small and marginal farmers"
+    },
+    {
+        "scheme": "Pradhan Mantri Fasal Bima Yojana",
+        "description": "Crop insurance scheme",
+        "amount": "Premium support up to 2%",
+        "eligibility": "All farmers"
+    },
+    {
+        "scheme": "Kisan Credit Card",
+        "description": "Credit facility for agricultural needs",
+        "amount": "Based on crop area and pattern",
+        "eligibility": "All farmers with land records"
+    }
+)
+
+# Lowercased (scheme, description) per result, for query matching
+_SUBSIDY_SEARCH_KEYS = tuple(
+    (subsidy["scheme"].lower(), subsidy["description"].lower()) for subsidy in _SUBSIDY_RESULTS
+)
+
+# Each result rendered once, numbered by its position in _SUBSIDY_RESULTS
+_SUBSIDY_FORMATTED = tuple(
+    f"{i}. {subsidy['scheme']}\\n"
+    f"   Description: {subsidy['description']}\\n"
+    f"   Amount: {subsidy['amount']}\\n"
+    f"   Eligibility: {subsidy['eligibility']}\\n\\n"
+    for i, subsidy in enumerate(_SUBSIDY_RESULTS, 1)
+)
+
+def _matching_subsidies(query_lower):
+    """Positions of the results whose scheme or description contains the query"""
+    return tuple(
+        i for i, (scheme, description) in enumerate(_SUBSIDY_SEARCH_KEYS)
+        if query_lower in scheme or query_lower in description
+    )
+
+# Word -> matching result positions, precomputed so whole-word queries
+# skip the substring scan
+_SUBSIDY_INDEX = {
+    word: _matching_subsidies(word)
+    for keys in _SUBSIDY_SEARCH_KEYS
+    for word in " ".join(keys).split()
+}
+
+_MANDI_PRICES = {
+    "rice": 2500,
+    "wheat": 2100,
+    "tomato": 1800,
+    "onion": 1200,
+    "potato": 1500,
+    "cotton": 5800,
+    "sugarcane": 3200
+}
+
+_WEATHER_CONDITIONS = ("Clear", "Partly Cloudy", "Cloudy", "Light Rain")
+
+# Output templates for the price and weather tools
+_PRICE_TEMPLATE = (
+    "Market Price for {crop} in {district}:\\n\\n"
+    "Current Price: ₹{current_price}/quintal\\n"
+    "Previous Day: ₹{base_price}/quintal\\n"
+    "Change: {change}\\n"
+    "\\nMarket: {district} Mandi\\n"
+    "Last Updated: Today\\n\\n"
+    "Note: This is mock data. Real MCP servers will provide live market prices."
+)
+
+# Change line by sign of the price change
+_PRICE_CHANGE = {1: "+₹{} (↗️)", -1: "₹{} (↘️)", 0: "No change (➡️)"}
+
+_WEATHER_TEMPLATE = (
+    "Current Weather in {location}:\\n\\n"
+    "Temperature: {temp}°C\\n"
+    "Condition: {condition}\\n"
+    "Humidity: {humidity}%\\n"
+    "Wind: {wind} km/h\\n\\n"
+)
+
+# Advisory lines, in output order, and their text for every combination:
+# index bit 0 = hot (>30°C), bit 1 = humid (>80%), bit 2 = light rain
+_WEATHER_ADVICE = (
+    "Agricultural Advisory: High temperature - ensure adequate irrigation.\\n",
+    "Agricultural Advisory: High humidity - monitor for diseases.\\n",
+    "Agricultural Advisory: Light rain expected - good for crops.\\n",
+)
+_WEATHER_ADVICE_TABLE = tuple(
+    "".join(line for bit, line in enumerate(_WEATHER_ADVICE) if flags >> bit & 1)
+    for flags in range(1 << len(_WEATHER_ADVICE))
+)
+
+_WEATHER_NOTE = "\\nNote: This is mock weather data. Real MCP servers will provide live weather information."
+
 def create_mock_subsidy_tool() -> FunctionTool:
     """Create a mock subsidy search tool"""
     
     def subsidy_search(query: str = "") -> str:
         """Mock subsidy search function"""
-        mock_results = [
-            {
-                "scheme": "PM-KISAN Samman Nidhi",
-                "description": "Direct income support to farmers",
-                "amount": "₹6,000 per year",
-                "eligibility": "Small and marginal farmers"
-            },
-            {
-                "scheme": "Pradhan Mantri Fasal Bima Yojana",
-                "description": "Crop insurance scheme",
-                "amount": "Premium support up to 2%",
-                "eligibility": "All farmers"
-            },
-            {
-                "scheme": "Kisan Credit Card",
-                "description": "Credit facility for agricultural needs",
-                "amount": "Based on crop area and pattern",
-                "eligibility": "All farmers with land records"
-            }
-        ]
-        
-        result = f"Subsidy search results for '{query}':\\n\\n"
+        header = f"Subsidy search results for '{query}':\\n\\n"
+        footer = "Note: This is mock data. Real MCP servers will provide live subsidy information."
         
-        for i, subsidy in enumerate(mock_results, 1):
-            if query.lower() in subsidy["scheme"].lower() or query.lower() in subsidy["description"].lower() or not query:
-                result += f"{i}. {subsidy['scheme']}\\n"
-                result += f"   Description: {subsidy['description']}\\n"
-                result += f"   Amount: {subsidy['amount']}\\n"
-                result += f"   Eligibility: {subsidy['eligibility']}\\n\\n"
+        if not query:
+            selected = _SUBSIDY_FORMATTED
+        else:
+            query_lower = query.lower()
+            positions = _SUBSIDY_INDEX.get(query_lower)
+            if positions is None:
+                positions = _matching_subsidies(query_lower)
+            selected = [_SUBSIDY_FORMATTED[i] for i in positions]
         
-        result += "Note: This is mock data. Real MCP servers will provide live subsidy information."
-        return result
+        return "".join([header, *selected, footer])
     
     return FunctionTool.from_defaults(
         fn=subsidy_search,
@@ -81,41 +165,22 @@ def create_mock_price_tool() -> FunctionTool:
     
     def get_mandi_price(crop: str = "", district: str = "Mysuru") -> str:
         """Mock price lookup function"""
-        import random
-        
-        mock_prices = {
-            "rice": 2500,
-            "wheat": 2100,
-            "tomato": 1800,
-            "onion": 1200,
-            "potato": 1500,
-            "cotton": 5800,
-            "sugarcane": 3200
-        }
-        
         crop_lower = crop.lower()
-        base_price = mock_prices.get(crop_lower, random.randint(1500, 4000))
+        base_price = _MANDI_PRICES.get(crop_lower, _rng.randint(1500, 4000))
         
         # Add some variation
-        current_price = base_price + random.randint(-200, 200)
-        
-        result = f"Market Price for {crop.title()} in {district}:\\n\\n"
-        result += f"Current Price: ₹{current_price}/quintal\\n"
-        result += f"Previous Day: ₹{base_price}/quintal\\n"
+        current_price = base_price + _rng.randint(-200, 200)
         
         change = current_price - base_price
-        if change > 0:
-            result += f"Change: +₹{change} (↗️)\\n"
-        elif change < 0:
-            result += f"Change: ₹{change} (↘️)\\n"
-        else:
-            result += "Change: No change (➡️)\\n"
+        sign = (change > 0) - (change < 0)
         
-        result += f"\\nMarket: {district} Mandi\\n"
-        result += f"Last Updated: Today\\n\\n"
-        result += "Note: This is mock data. Real MCP servers will provide live market prices."
-        
-        return result
+        return _PRICE_TEMPLATE.format(
+            crop=crop.title(),
+            district=district,
+            current_price=current_price,
+            base_price=base_price,
+            change=_PRICE_CHANGE[sign].format(change),
+        )
     
     return FunctionTool.from_defaults(
         fn=get_mandi_price,
@@ -128,30 +193,22 @@ def create_mock_weather_tool() -> FunctionTool:
     
     def get_current_weather(location: str = "Mysuru") -> str:
         """Mock weather function"""
-        import random
-        
-        temp = random.randint(22, 32)
-        humidity = random.randint(65, 85)
-        conditions = ["Clear", "Partly Cloudy", "Cloudy", "Light Rain"]
-        condition = random.choice(conditions)
+        temp = _rng.randint(22, 32)
+        humidity = _rng.randint(65, 85)
+        condition = _rng.choice(_WEATHER_CONDITIONS)
         
-        result = f"Current Weather in {location}:\\n\\n"
-        result += f"Temperature: {temp}°C\\n"
-        result += f"Condition: {condition}\\n"
-        result += f"Humidity: {humidity}%\\n"
-        result += f"Wind: {random.randint(5, 15)} km/h\\n\\n"
+        report = _WEATHER_TEMPLATE.format(
+            location=location,
+            temp=temp,
+            condition=condition,
+            humidity=humidity,
+            wind=_rng.randint(5, 15),
+        )
         
         # Agricultural advice
-        if temp > 30:
-            result += "Agricultural Advisory: High temperature - ensure adequate irrigation.\\n"
-        if humidity > 80:
-            result += "Agricultural Advisory: High humidity - monitor for diseases.\\n"
-        if condition == "Light Rain":
-            result += "Agricultural Advisory: Light rain expected - good for crops.\\n"
-        
-        result += "\\nNote: This is mock weather data. Real MCP servers will provide live weather information."
+        flags = (temp > 30) | (humidity > 80) << 1 | (condition == "Light Rain") << 2
         
-        return result
+        return "".join((report, _WEATHER_ADVICE_TABLE[flags], _WEATHER_NOTE))
     
     return FunctionTool.from_defaults(
         fn=get_current_weather,
@@ -186,21 +243,21 @@ if __name__ == "__main__":
     print("Testing Mock MCP Tools")
     print("=" * 30)
     
+    # Arguments to call each tool with; other tools run with none
+    test_args = {
+        "subsidy_search": {"query": "tractor"},
+        "get_mandi_price": {"crop": "tomato", "district": "Mysuru"},
+        "get_current_weather": {"location": "Bangalore"},
+    }
+    
     tools = load_mcp_tools()
     
     for tool in tools:
         print(f"\\nTesting {tool.metadata.name}:")
         print("-" * 20)
         
-        if tool.metadata.name == "subsidy_search":
-            result = tool.fn(query="tractor")
-        elif tool.metadata.name == "get_mandi_price":
-            result = tool.fn(crop="tomato", district="Mysuru")
-        elif tool.metadata.name == "get_current_weather":
-            result = tool.fn(location="Bangalore")
-        else:
-            result = tool.fn()
-            
+        result = tool.fn(**test_args.get(tool.metadata.name, {}))
+        
         # Convert result to string if it's not already
         result_str = str(result)
         print(result_str[:200] + "..." if len(result_str) > 200 else result_str)